@@ -3,6 +3,8 @@
 
 import streamlit as st
 import json
+import os
+import re
 import asyncio
 import time
 import logging
@@ -27,9 +29,19 @@ from utils.metadata_handler import (
     format_for_ai_prompt,
     get_default_metadata_structure
 )
-from utils.validation_errors import validate_image_upload
+from utils.validation_errors import validate_image_upload, ImageValidationError
 from utils.error_handler import ErrorContext
 from workflow.engine import create_workflow_engine, WorkflowStep
+from prompts.templates import (
+    DAM_ANALYST_ROLE, TASK_INSTRUCTIONS, OUTPUT_GUIDELINES,
+    JOB_AID_PROMPT, FINDINGS_PROMPT
+)
+from schemas.job_aid import (
+    DIGITAL_COMPONENT_ANALYSIS_SCHEMA,
+    DIGITAL_COMPONENT_ANALYSIS_SCHEMA_JSON,
+    JOB_AID_SCHEMA_PATH,
+    check_job_aid_schema
+)
 
 
 def display_file_details(uploaded_file, image, embedded_metadata):
@@ -655,7 +667,6 @@ def display_step1_results(step_data: Dict[str, Any]):
         # Parse job aid if it's a string
         if isinstance(job_aid, str):
             try:
-                import json
                 job_aid = json.loads(job_aid)
             except json.JSONDecodeError:
                 # If it's not valid JSON, display as text
@@ -1163,12 +1174,6 @@ def create_prompt_management_interface():
     st.subheader("📝 Workflow Prompt Management")
     st.markdown("Customize the AI prompts used in each step of the analysis workflow.")
     
-    # Import current prompts
-    from prompts.templates import (
-        DAM_ANALYST_ROLE, TASK_INSTRUCTIONS, OUTPUT_GUIDELINES,
-        JOB_AID_PROMPT, FINDINGS_PROMPT
-    )
-    
     # Create tabs for each step
     step_tabs = st.tabs(["🔍 Step 1: DAM Analysis", "📋 Step 2: Job Aid Assessment", "📤 Step 3: Findings Transmission"])
     
@@ -1359,8 +1364,6 @@ def create_system_settings_interface():
     # Image validation settings
     st.markdown("#### 📏 Image Validation Settings")
     
-    from utils.validation_errors import ImageValidationError
-    
     col1, col2 = st.columns(2)
     
     with col1:
@@ -1424,14 +1427,28 @@ def create_analytics_interface():
     st.info("📝 Activity logs and audit trail coming soon!")
 
 
+def atomic_write_text(path, content):
+    """
+    Replace a file's contents atomically.
+    
+    The content is written to a sibling temporary file which is then renamed
+    over the target, so readers never see a partially written file and a
+    failed write leaves the original untouched.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def save_step1_prompts(dam_role, task_instructions, output_guidelines):
-    """Save Step 1 prompts to file with backup and error handling."""
+    """Save Step 1 prompts to file with error handling."""
     try:
-        # Create backup first
-        backup_path = 'prompts/templates.py.backup'
-        with open('prompts/templates.py', 'r') as src, open(backup_path, 'w') as dst:
-            dst.write(src.read())
-        
         # Read current file
         with open('prompts/templates.py', 'r') as f:
             content = f.read()
@@ -1455,29 +1472,13 @@ def save_step1_prompts(dam_role, task_instructions, output_guidelines):
             return False
         
         # Write back to file
-        with open('prompts/templates.py', 'w') as f:
-            f.write(content)
-        
-        # Remove backup if successful
-        import os
-        os.remove(backup_path)
+        atomic_write_text('prompts/templates.py', content)
         
         return True
         
     except Exception as e:
         logger.error(f"Error saving Step 1 prompts: {str(e)}")
         st.error(f"Error saving Step 1 prompts: {str(e)}")
-        
-        # Try to restore from backup
-        try:
-            if os.path.exists(backup_path):
-                with open(backup_path, 'r') as src, open('prompts/templates.py', 'w') as dst:
-                    dst.write(src.read())
-                os.remove(backup_path)
-                st.warning("Restored from backup due to error.")
-        except:
-            pass
-        
         return False
 
 
@@ -1492,8 +1493,7 @@ def save_step2_prompts(job_aid_prompt):
         content = update_prompt_in_content(content, 'JOB_AID_PROMPT', job_aid_prompt)
         
         # Write back to file
-        with open('prompts/templates.py', 'w') as f:
-            f.write(content)
+        atomic_write_text('prompts/templates.py', content)
         
         return True
     except Exception as e:
@@ -1512,8 +1512,7 @@ def save_step3_prompts(findings_prompt):
         content = update_prompt_in_content(content, 'FINDINGS_PROMPT', findings_prompt)
         
         # Write back to file
-        with open('prompts/templates.py', 'w') as f:
-            f.write(content)
+        atomic_write_text('prompts/templates.py', content)
         
         return True
     except Exception as e:
@@ -1523,8 +1522,6 @@ def save_step3_prompts(findings_prompt):
 
 def update_prompt_in_content(content, variable_name, new_value):
     """Update a prompt variable in the file content safely."""
-    import re
-    
     try:
         # Simple and safe approach - just replace the content between triple quotes
         # First, escape any triple quotes in the new value to prevent syntax errors
@@ -1570,12 +1567,6 @@ def create_prompt_management_interface():
     st.subheader("📝 Workflow Prompt Management")
     st.markdown("Customize the AI prompts used in each step of the analysis workflow.")
     
-    # Import current prompts
-    from prompts.templates import (
-        DAM_ANALYST_ROLE, TASK_INSTRUCTIONS, OUTPUT_GUIDELINES,
-        JOB_AID_PROMPT, FINDINGS_PROMPT
-    )
-    
     # Create tabs for each step
     step_tabs = st.tabs(["🔍 Step 1: DAM Analysis", "📋 Step 2: Job Aid Assessment", "📤 Step 3: Findings Transmission"])
     
@@ -1589,14 +1580,17 @@ def create_prompt_management_interface():
         manage_step3_prompts(FINDINGS_PROMPT)
 
 
+@st.cache_data(max_entries=4)
+def _parse_schema(schema_text: str) -> Any:
+    """Parse edited schema text, reusing the result while the text is unchanged."""
+    return json.loads(schema_text)
+
+
 def create_schema_management_interface():
     """Creates the schema management interface."""
     st.subheader("📋 Job Aid Schema Management")
     st.markdown("Customize the job aid schema that defines the structure for Step 2 compliance assessment.")
     
-    # Import current schema
-    from schemas.job_aid import DIGITAL_COMPONENT_ANALYSIS_SCHEMA
-    
     # Display current schema
     st.markdown("#### 📊 Current Job Aid Schema")
     st.markdown("This schema defines the structure and validation rules for the job aid assessment in Step 2.")
@@ -1610,7 +1604,7 @@ def create_schema_management_interface():
     st.markdown("**⚠️ Warning:** Modifying the schema may affect the workflow. Ensure the schema is valid JSON before saving.")
     
     # Convert schema to formatted JSON string for editing
-    current_schema_json = json.dumps(DIGITAL_COMPONENT_ANALYSIS_SCHEMA, indent=2)
+    current_schema_json = DIGITAL_COMPONENT_ANALYSIS_SCHEMA_JSON
     
     # Text area for schema editing
     new_schema_json = st.text_area(
@@ -1628,7 +1622,7 @@ def create_schema_management_interface():
         if st.button("🔍 Validate Schema", key="validate_schema"):
             try:
                 # Try to parse the JSON
-                parsed_schema = json.loads(new_schema_json)
+                parsed_schema = _parse_schema(new_schema_json)
                 
                 # Basic validation - check if it has the expected structure
                 if "type" in parsed_schema and "properties" in parsed_schema:
@@ -1649,7 +1643,7 @@ def create_schema_management_interface():
         if st.button("💾 Save Schema Changes", key="save_schema"):
             try:
                 # Validate JSON first
-                parsed_schema = json.loads(new_schema_json)
+                parsed_schema = _parse_schema(new_schema_json)
                 
                 # Save the schema
                 if save_job_aid_schema(parsed_schema):
@@ -1661,6 +1655,8 @@ def create_schema_management_interface():
                     
             except json.JSONDecodeError as e:
                 st.error(f"❌ Cannot save invalid JSON: {str(e)}")
+            except ValueError as e:
+                st.error(f"❌ Cannot save schema: {str(e)}")
             except Exception as e:
                 st.error(f"❌ Error saving schema: {str(e)}")
     
@@ -1748,8 +1744,6 @@ def create_system_settings_interface():
     # Image validation settings (read-only for now)
     st.markdown("#### 📏 Image Validation Settings")
     
-    from utils.validation_errors import ImageValidationError
-    
     col1, col2 = st.columns(2)
     
     with col1:
@@ -1769,56 +1763,23 @@ def create_system_settings_interface():
 
 
 def save_job_aid_schema(schema_dict):
-    """Save the job aid schema to file."""
+    """
+    Save the job aid schema to its JSON data file.
+    
+    The schema is checked before writing, since schemas.job_aid loads the
+    file at import.
+    
+    Raises:
+        ValueError: If the schema is invalid or cannot be processed
+    """
+    check_job_aid_schema(schema_dict)
+    
     try:
-        # Create backup first
-        backup_path = 'schemas/job_aid.py.backup'
-        with open('schemas/job_aid.py', 'r') as src, open(backup_path, 'w') as dst:
-            dst.write(src.read())
-        
-        # Read current file
-        with open('schemas/job_aid.py', 'r') as f:
-            content = f.read()
-        
-        # Update the schema in the file content
-        schema_json = json.dumps(schema_dict, indent=4)
-        
-        # Find and replace the DIGITAL_COMPONENT_ANALYSIS_SCHEMA
-        import re
-        pattern = r'(DIGITAL_COMPONENT_ANALYSIS_SCHEMA\s*=\s*){.*?}(?=\n\n|\n#|\nFINDINGS_OUTPUT_SCHEMA|\Z)'
-        replacement = f'\\1{schema_json}'
-        
-        new_content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-        
-        # Validate the updated content
-        try:
-            compile(new_content, 'schemas/job_aid.py', 'exec')
-        except SyntaxError as e:
-            logger.error(f"Syntax error in updated schema: {str(e)}")
-            return False
-        
-        # Write back to file
-        with open('schemas/job_aid.py', 'w') as f:
-            f.write(new_content)
-        
-        # Remove backup if successful
-        import os
-        os.remove(backup_path)
-        
+        atomic_write_text(JOB_AID_SCHEMA_PATH, json.dumps(schema_dict, indent=2) + "\n")
         return True
         
     except Exception as e:
         logger.error(f"Error saving job aid schema: {str(e)}")
-        
-        # Try to restore from backup
-        try:
-            if os.path.exists(backup_path):
-                with open(backup_path, 'r') as src, open('schemas/job_aid.py', 'w') as dst:
-                    dst.write(src.read())
-                os.remove(backup_path)
-        except:
-            pass
-        
         return False
 
 
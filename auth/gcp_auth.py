@@ -16,6 +16,12 @@ import streamlit as st
 
 logger = logging.getLogger(__name__)
 
+# Fields every service account key must provide
+_REQUIRED_SA_FIELDS = frozenset({
+    "type", "project_id", "private_key_id", "private_key",
+    "client_email", "client_id", "auth_uri", "token_uri"
+})
+
 
 class GCPAuthenticationError(Exception):
     """Custom exception for GCP authentication errors"""
@@ -30,6 +36,8 @@ class GCPAuthManager:
     and providing authenticated credentials for GCP services.
     """
     
+    __slots__ = ('_credentials', '_project_id')
+    
     def __init__(self):
         self._credentials: Optional[service_account.Credentials] = None
         self._project_id: Optional[str] = None
@@ -52,16 +60,12 @@ class GCPAuthManager:
                     "Please configure 'gcp_service_account' in your secrets."
                 )
             
-            # Get the service account info from secrets
-            service_account_info = dict(st.secrets["gcp_service_account"])
+            # Get the service account info from secrets. google-auth only reads
+            # from the mapping, so the secrets section is used without copying.
+            service_account_info = st.secrets["gcp_service_account"]
             
             # Validate required fields
-            required_fields = [
-                "type", "project_id", "private_key_id", "private_key",
-                "client_email", "client_id", "auth_uri", "token_uri"
-            ]
-            
-            missing_fields = [field for field in required_fields if field not in service_account_info]
+            missing_fields = sorted(_REQUIRED_SA_FIELDS.difference(service_account_info))
             if missing_fields:
                 raise GCPAuthenticationError(
                     f"Missing required fields in service account credentials: {missing_fields}"
@@ -187,7 +191,6 @@ class GCPAuthManager:
         try:
             if not self._credentials.valid:
                 if self._credentials.expired and hasattr(self._credentials, 'refresh'):
-                    from google.auth.transport.requests import Request
                     self._credentials.refresh(Request())
                     logger.info("Successfully refreshed authentication token")
                 else:
@@ -6,9 +6,12 @@ DAM Compliance Analyzer application. These templates are designed to be used
 with the Google Gemini API for multimodal analysis of digital assets.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
+from functools import cache
 import json
 
+from schemas.job_aid import DIGITAL_COMPONENT_ANALYSIS_SCHEMA, FINDINGS_OUTPUT_SCHEMA, inline_schema_refs
+
 
 # Step 1: DAM Analysis - Role and Task Format
 DAM_ANALYST_ROLE = """
@@ -161,6 +164,12 @@ IMPORTANT:
 """
 
 
+# Step 1 prompt pieces assembled once at import; only the metadata varies per call
+_STEP1_NO_METADATA = "\n\n".join([DAM_ANALYST_ROLE, TASK_INSTRUCTIONS, OUTPUT_GUIDELINES])
+_STEP1_METADATA_PREFIX = DAM_ANALYST_ROLE + "\n\nMETADATA:\n```json\n"
+_STEP1_METADATA_SUFFIX = "\n```\n\n\n" + TASK_INSTRUCTIONS + "\n\n" + OUTPUT_GUIDELINES
+
+
 def format_step1_prompt(metadata: Optional[Dict[str, Any]] = None) -> str:
     """
     Format the complete prompt for Step 1: DAM Analysis.
@@ -171,34 +180,64 @@ def format_step1_prompt(metadata: Optional[Dict[str, Any]] = None) -> str:
     Returns:
         str: Formatted prompt for Step 1
     """
-    prompt_parts = [
-        DAM_ANALYST_ROLE,
-        TASK_INSTRUCTIONS,
-        OUTPUT_GUIDELINES
-    ]
-    
-    if metadata:
-        metadata_str = json.dumps(metadata, indent=2)
-        prompt_parts.insert(1, f"METADATA:\n```json\n{metadata_str}\n```\n")
+    if not metadata:
+        return _STEP1_NO_METADATA
     
-    return "\n\n".join(prompt_parts)
+    metadata_str = json.dumps(metadata, indent=2)
+    return _STEP1_METADATA_PREFIX + metadata_str + _STEP1_METADATA_SUFFIX
+
+
+def _job_aid_schema_text(job_aid_schema: Dict[str, Any]) -> str:
+    """Indented job aid schema for the prompt, with $ref pointers inlined."""
+    try:
+        job_aid_schema = inline_schema_refs(job_aid_schema)
+    except ValueError:
+        # Recursive or dangling refs cannot be expanded; send the schema as stored
+        pass
+    return json.dumps(job_aid_schema, indent=2)
+
+
+@cache
+def _default_job_aid_section() -> str:
+    """JOB_AID_PROMPT formatted with the built-in job aid schema."""
+    return JOB_AID_PROMPT.format(job_aid_schema=_job_aid_schema_text(DIGITAL_COMPONENT_ANALYSIS_SCHEMA))
+
+
+@cache
+def _default_findings_section() -> str:
+    """FINDINGS_PROMPT formatted with the built-in findings schema."""
+    return FINDINGS_PROMPT.format(findings_schema=json.dumps(FINDINGS_OUTPUT_SCHEMA, indent=2))
+
+
+def _job_aid_section(job_aid_schema: Dict[str, Any]) -> str:
+    """JOB_AID_PROMPT formatted with the given schema, reusing the cached default."""
+    if job_aid_schema is DIGITAL_COMPONENT_ANALYSIS_SCHEMA:
+        return _default_job_aid_section()
+    return JOB_AID_PROMPT.format(job_aid_schema=_job_aid_schema_text(job_aid_schema))
+
+
+def _findings_section(findings_schema: Dict[str, Any]) -> str:
+    """FINDINGS_PROMPT formatted with the given schema, reusing the cached default."""
+    if findings_schema is FINDINGS_OUTPUT_SCHEMA:
+        return _default_findings_section()
+    return FINDINGS_PROMPT.format(findings_schema=json.dumps(findings_schema, indent=2))
 
 
-def format_step2_prompt(job_aid_schema: Dict[str, Any], step1_results: Dict[str, Any], 
+def format_step2_prompt(job_aid_schema: Dict[str, Any], step1_results: Union[Dict[str, Any], str],
                         metadata: Optional[Dict[str, Any]] = None) -> str:
     """
     Format the complete prompt for Step 2: Job Aid Assessment.
     
     Args:
         job_aid_schema: The complete job aid schema
-        step1_results: Results from Step 1
+        step1_results: Results from Step 1, as a dict or an already serialized JSON string
         metadata: Optional metadata to include in the prompt
         
     Returns:
         str: Formatted prompt for Step 2
     """
-    job_aid_schema_str = json.dumps(job_aid_schema, indent=2)
-    step1_results_str = json.dumps(step1_results, indent=2)
+    job_aid_section = _job_aid_section(job_aid_schema)
+    step1_results_str = step1_results if isinstance(step1_results, str) else json.dumps(step1_results, indent=2)
     
     prompt = f"""
 {DAM_ANALYST_ROLE}
@@ -208,7 +247,7 @@ STEP 1 RESULTS:
 {step1_results_str}
 ```
 
-{JOB_AID_PROMPT.format(job_aid_schema=job_aid_schema_str)}
+{job_aid_section}
 """
     
     if metadata:
@@ -226,27 +265,27 @@ STEP 1 RESULTS:
 {step1_results_str}
 ```
 
-{JOB_AID_PROMPT.format(job_aid_schema=job_aid_schema_str)}
+{job_aid_section}
 """
     
     return prompt
 
 
-def format_step3_prompt(findings_schema: Dict[str, Any], step2_results: Dict[str, Any],
+def format_step3_prompt(findings_schema: Dict[str, Any], step2_results: Union[Dict[str, Any], str],
                        metadata: Optional[Dict[str, Any]] = None) -> str:
     """
     Format the complete prompt for Step 3: Findings Transmission.
     
     Args:
         findings_schema: The schema for findings output
-        step2_results: Results from Step 2
+        step2_results: Results from Step 2, as a dict or an already serialized JSON string
         metadata: Optional metadata to include in the prompt
         
     Returns:
         str: Formatted prompt for Step 3
     """
-    findings_schema_str = json.dumps(findings_schema, indent=2)
-    step2_results_str = json.dumps(step2_results, indent=2)
+    findings_section = _findings_section(findings_schema)
+    step2_results_str = step2_results if isinstance(step2_results, str) else json.dumps(step2_results, indent=2)
     
     prompt = f"""
 {DAM_ANALYST_ROLE}
@@ -256,7 +295,7 @@ STEP 2 RESULTS:
 {step2_results_str}
 ```
 
-{FINDINGS_PROMPT.format(findings_schema=findings_schema_str)}
+{findings_section}
 """
     
     if metadata:
@@ -274,7 +313,7 @@ STEP 2 RESULTS:
 {step2_results_str}
 ```
 
-{FINDINGS_PROMPT.format(findings_schema=findings_schema_str)}
+{findings_section}
 """
     
     return prompt
@@ -4,11 +4,20 @@ Schema management package for DAM Compliance Analyzer.
 
 from .job_aid import (
     DIGITAL_COMPONENT_ANALYSIS_SCHEMA,
+    DIGITAL_COMPONENT_ANALYSIS_SCHEMA_JSON,
     FINDINGS_OUTPUT_SCHEMA,
     get_job_aid_schema,
     get_findings_schema,
+    get_job_aid_schema_hash,
+    get_findings_schema_hash,
+    key_for,
+    inline_schema_refs,
+    get_validator_for,
     validate_job_aid_data,
     validate_findings_data,
+    is_valid_job_aid_data,
+    is_valid_findings_data,
+    check_job_aid_schema,
     create_empty_job_aid,
     create_empty_findings_output,
     extract_assessment_summary
@@ -16,11 +25,20 @@ from .job_aid import (
 
 __all__ = [
     'DIGITAL_COMPONENT_ANALYSIS_SCHEMA',
+    'DIGITAL_COMPONENT_ANALYSIS_SCHEMA_JSON',
     'FINDINGS_OUTPUT_SCHEMA',
     'get_job_aid_schema',
     'get_findings_schema',
+    'get_job_aid_schema_hash',
+    'get_findings_schema_hash',
+    'key_for',
+    'inline_schema_refs',
+    'get_validator_for',
     'validate_job_aid_data',
     'validate_findings_data',
+    'is_valid_job_aid_data',
+    'is_valid_findings_data',
+    'check_job_aid_schema',
     'create_empty_job_aid',
     'create_empty_findings_output',
     'extract_assessment_summary'
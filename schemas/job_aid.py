@@ -5,422 +5,28 @@ This module defines the complete job aid schema for the DAM Compliance Analyzer
 and provides validation functions to ensure data conforms to the schema.
 """
 
-from typing import Dict, Any, List, Optional, Union, Literal
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple, Callable
+from functools import lru_cache
+import copy
+import hashlib
 import json
-import jsonschema
-from jsonschema import validate, ValidationError
+from pathlib import Path
+from urllib.parse import unquote
 
+# jsonschema and the optional accelerators are imported on first validation,
+# so callers that only need the schema constants don't pay for them
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
 
-# Complete Digital Component Analysis Job Aid Schema
-DIGITAL_COMPONENT_ANALYSIS_SCHEMA = {
-    "type": "object",
-    "properties": {
-        "digital_component_analysis": {
-            "type": "object",
-            "properties": {
-                "instructions": {
-                    "type": "string",
-                    "description": "General instructions for completing the job aid"
-                },
-                "component_specifications": {
-                    "type": "object",
-                    "properties": {
-                        "file_format_requirements": {
-                            "type": "object",
-                            "properties": {
-                                "allowed_formats": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                },
-                                "format_restrictions": {
-                                    "type": "string"
-                                },
-                                "assessment": {
-                                    "type": "string",
-                                    "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                },
-                                "notes": {
-                                    "type": "string"
-                                }
-                            }
-                        },
-                        "resolution_requirements": {
-                            "type": "object",
-                            "properties": {
-                                "minimum_resolution": {
-                                    "type": "string"
-                                },
-                                "optimal_resolution": {
-                                    "type": "string"
-                                },
-                                "assessment": {
-                                    "type": "string",
-                                    "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                },
-                                "notes": {
-                                    "type": "string"
-                                }
-                            }
-                        },
-                        "color_profile_requirements": {
-                            "type": "object",
-                            "properties": {
-                                "required_profile": {
-                                    "type": "string"
-                                },
-                                "color_space": {
-                                    "type": "string"
-                                },
-                                "assessment": {
-                                    "type": "string",
-                                    "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                },
-                                "notes": {
-                                    "type": "string"
-                                }
-                            }
-                        },
-                        "naming_convention_requirements": {
-                            "type": "object",
-                            "properties": {
-                                "pattern": {
-                                    "type": "string"
-                                },
-                                "examples": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                },
-                                "assessment": {
-                                    "type": "string",
-                                    "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                },
-                                "notes": {
-                                    "type": "string"
-                                }
-                            }
-                        },
-                        "assessment": {
-                            "type": "string",
-                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                        },
-                        "notes": {
-                            "type": "string"
-                        }
-                    }
-                },
-                "component_metadata": {
-                    "type": "object",
-                    "properties": {
-                        "required_fields": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        },
-                        "optional_fields": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        },
-                        "validation_rules": {
-                            "type": "object",
-                            "additionalProperties": {
-                                "type": "string"
-                            }
-                        },
-                        "assessment": {
-                            "type": "string",
-                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                        },
-                        "notes": {
-                            "type": "string"
-                        }
-                    }
-                },
-                "component_qc": {
-                    "type": "object",
-                    "properties": {
-                        "visual_quality_checks": {
-                            "type": "object",
-                            "properties": {
-                                "clarity": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                },
-                                "lighting": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                },
-                                "composition": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                },
-                                "color_accuracy": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                }
-                            }
-                        },
-                        "technical_quality_checks": {
-                            "type": "object",
-                            "properties": {
-                                "compression_artifacts": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                },
-                                "noise_levels": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                },
-                                "sharpness": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                }
-                            }
-                        },
-                        "compliance_checks": {
-                            "type": "object",
-                            "properties": {
-                                "brand_guidelines": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                },
-                                "legal_requirements": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                },
-                                "accessibility_standards": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                }
-                            }
-                        },
-                        "assessment": {
-                            "type": "string",
-                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                        },
-                        "notes": {
-                            "type": "string"
-                        }
-                    }
-                },
-                "component_linking": {
-                    "type": "object",
-                    "properties": {
-                        "relationship_requirements": {
-                            "type": "object",
-                            "properties": {
-                                "required_links": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                },
-                                "assessment": {
-                                    "type": "string",
-                                    "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                },
-                                "notes": {
-                                    "type": "string"
-                                }
-                            }
-                        },
-                        "dependency_checks": {
-                            "type": "object",
-                            "properties": {
-                                "dependencies": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                },
-                                "assessment": {
-                                    "type": "string",
-                                    "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                },
-                                "notes": {
-                                    "type": "string"
-                                }
-                            }
-                        },
-                        "assessment": {
-                            "type": "string",
-                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                        },
-                        "notes": {
-                            "type": "string"
-                        }
-                    }
-                },
-                "material_distribution_package_qc": {
-                    "type": "object",
-                    "properties": {
-                        "package_integrity_checks": {
-                            "type": "object",
-                            "properties": {
-                                "completeness": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                },
-                                "consistency": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                }
-                            }
-                        },
-                        "distribution_readiness_checks": {
-                            "type": "object",
-                            "properties": {
-                                "channel_requirements": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                },
-                                "delivery_specifications": {
-                                    "type": "object",
-                                    "properties": {
-                                        "assessment": {
-                                            "type": "string",
-                                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                                        },
-                                        "notes": {
-                                            "type": "string"
-                                        }
-                                    }
-                                }
-                            }
-                        },
-                        "assessment": {
-                            "type": "string",
-                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                        },
-                        "notes": {
-                            "type": "string"
-                        }
-                    }
-                },
-                "overall_assessment": {
-                    "type": "object",
-                    "properties": {
-                        "status": {
-                            "type": "string",
-                            "enum": ["PASS", "FAIL", "NEEDS_REVIEW"]
-                        },
-                        "summary": {
-                            "type": "string"
-                        },
-                        "critical_issues": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        },
-                        "recommendations": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        }
-                    },
-                    "required": ["status"]
-                }
-            }
-        }
-    },
-    "required": ["digital_component_analysis"]
-}
+
+# Complete Digital Component Analysis Job Aid Schema, stored as JSON so the
+# settings page can rewrite it without touching Python source
+JOB_AID_SCHEMA_PATH = Path(__file__).parent / "job_aid.json"
+DIGITAL_COMPONENT_ANALYSIS_SCHEMA = json.loads(JOB_AID_SCHEMA_PATH.read_text(encoding="utf-8"))
+
+# Indented JSON shown in the settings editor; edits are saved to the data file
+# and picked up on restart, so the text is encoded once per process
+DIGITAL_COMPONENT_ANALYSIS_SCHEMA_JSON = json.dumps(DIGITAL_COMPONENT_ANALYSIS_SCHEMA, indent=2)
 
 
 # Findings Output Schema for Step 3
@@ -458,7 +64,8 @@ FINDINGS_OUTPUT_SCHEMA = {
                         "description": "Recommended action to resolve the issue"
                     }
                 },
-                "required": ["category", "description"]
+                "required": ["category", "description"],
+                "additionalProperties": False
             },
             "description": "List of compliance issues detected"
         },
@@ -480,7 +87,8 @@ FINDINGS_OUTPUT_SCHEMA = {
                         "description": "Recommended action to provide the missing information"
                     }
                 },
-                "required": ["field", "description"]
+                "required": ["field", "description"],
+                "additionalProperties": False
             },
             "description": "List of missing information that prevented complete assessment"
         },
@@ -492,10 +100,168 @@ FINDINGS_OUTPUT_SCHEMA = {
             "description": "List of recommendations for improving compliance"
         }
     },
-    "required": ["component_id", "check_status"]
+    "required": ["component_id", "check_status"],
+    "additionalProperties": False
 }
 
 
+def _build_validator(schema: Dict[str, Any]) -> "Validator":
+    """Check a schema once and build a reusable validator for it."""
+    import jsonschema
+    
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def _compile_fast_validator(schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """
+    Build a boolean fast-path check for a schema from an optional accelerator.
+    
+    jsonschema-rs is preferred, then fastjsonschema. Returns None if neither
+    is installed or the schema cannot be compiled by them.
+    """
+    try:
+        import jsonschema_rs
+    except ImportError:
+        pass
+    else:
+        try:
+            return jsonschema_rs.validator_for(schema).is_valid
+        except ValueError:
+            pass
+    
+    try:
+        import fastjsonschema
+    except ImportError:
+        pass
+    else:
+        try:
+            # use_default=False keeps validation from writing defaults into the data
+            compiled = fastjsonschema.compile(schema, use_default=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            return None
+        
+        def is_valid(data: Any) -> bool:
+            try:
+                compiled(data)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+        
+        return is_valid
+    
+    return None
+
+
+def _is_valid(validator: "Validator",
+              fast_validator: Optional[Callable[[Any], bool]],
+              data: Any) -> bool:
+    """Check data without building any error objects."""
+    if fast_validator is not None:
+        return fast_validator(data)
+    return validator.is_valid(data)
+
+
+def _validate(validator: "Validator",
+              fast_validator: Optional[Callable[[Any], bool]],
+              data: Dict[str, Any]) -> None:
+    """
+    Raise the most relevant error for data, as jsonschema.validate does.
+    
+    When an accelerated fast-path check is available it handles the common
+    passing case; jsonschema is only consulted to build the error.
+    """
+    if fast_validator is not None and fast_validator(data):
+        return
+    
+    from jsonschema.exceptions import best_match
+    
+    error = best_match(validator.iter_errors(data))
+    if error is not None:
+        raise error
+
+
+def _canonical_json(schema: Dict[str, Any]) -> str:
+    """Serialize a schema independent of key order."""
+    return json.dumps(schema, sort_keys=True, separators=(",", ":"))
+
+
+def _digest(schema_json: str) -> str:
+    """Hash a canonical schema string."""
+    return hashlib.blake2b(schema_json.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def key_for(schema: Dict[str, Any]) -> str:
+    """
+    Get a cache key for a schema that is equal for equivalent schemas.
+    
+    Args:
+        schema: The JSON schema
+        
+    Returns:
+        str: Hex digest of the canonical JSON form of the schema
+    """
+    return _digest(_canonical_json(schema))
+
+
+# Validator and fast-path check per schema digest; the oldest entry is
+# dropped once the cache is full
+_VALIDATOR_CACHE_SIZE = 64
+_compiled_validator_cache: Dict[str, Tuple["Validator", Optional[Callable[[Any], bool]]]] = {}
+
+
+def _compiled_validators(schema_key: str,
+                         schema: Dict[str, Any]) -> Tuple["Validator", Optional[Callable[[Any], bool]]]:
+    """Get the validator and fast-path check for a schema, built once per digest."""
+    compiled = _compiled_validator_cache.get(schema_key)
+    if compiled is None:
+        # Build from a private copy so later edits to the caller's dict
+        # cannot change what the cached validator checks
+        schema = copy.deepcopy(schema)
+        compiled = (_build_validator(schema), _compile_fast_validator(schema))
+        if len(_compiled_validator_cache) >= _VALIDATOR_CACHE_SIZE:
+            del _compiled_validator_cache[next(iter(_compiled_validator_cache))]
+        _compiled_validator_cache[schema_key] = compiled
+    return compiled
+
+
+def get_validator_for(schema: Dict[str, Any]) -> "Validator":
+    """
+    Get a validator for a schema, compiled once per distinct schema.
+    
+    Validators are cached by the digest of the schema's canonical form rather
+    than by identity, so equal schemas built separately share one validator.
+    
+    Args:
+        schema: The JSON schema
+        
+    Returns:
+        Validator: A jsonschema validator for the schema
+        
+    Raises:
+        SchemaError: If the schema itself is invalid
+    """
+    return _compiled_validators(key_for(schema), schema)[0]
+
+
+# Digests of the module schemas, computed once. The validators are built on
+# first use, so the schema dicts above must be treated as read-only; schema
+# edits from the settings page take effect on the next process start.
+_JOB_AID_SCHEMA_HASH = key_for(DIGITAL_COMPONENT_ANALYSIS_SCHEMA)
+_FINDINGS_SCHEMA_HASH = key_for(FINDINGS_OUTPUT_SCHEMA)
+
+
+def _job_aid_validators() -> Tuple["Validator", Optional[Callable[[Any], bool]]]:
+    """Get the validator and fast-path check for the job aid schema."""
+    return _compiled_validators(_JOB_AID_SCHEMA_HASH, DIGITAL_COMPONENT_ANALYSIS_SCHEMA)
+
+
+def _findings_validators() -> Tuple["Validator", Optional[Callable[[Any], bool]]]:
+    """Get the validator and fast-path check for the findings output schema."""
+    return _compiled_validators(_FINDINGS_SCHEMA_HASH, FINDINGS_OUTPUT_SCHEMA)
+
+
 def get_job_aid_schema() -> Dict[str, Any]:
     """
     Get the complete job aid schema.
@@ -516,6 +282,26 @@ def get_findings_schema() -> Dict[str, Any]:
     return FINDINGS_OUTPUT_SCHEMA
 
 
+def get_job_aid_schema_hash() -> str:
+    """
+    Get a stable hash of the job aid schema for use as a cache key.
+    
+    Returns:
+        str: Hex digest of the canonical JSON form of the schema
+    """
+    return _JOB_AID_SCHEMA_HASH
+
+
+def get_findings_schema_hash() -> str:
+    """
+    Get a stable hash of the findings output schema for use as a cache key.
+    
+    Returns:
+        str: Hex digest of the canonical JSON form of the schema
+    """
+    return _FINDINGS_SCHEMA_HASH
+
+
 def validate_job_aid_data(data: Dict[str, Any]) -> bool:
     """
     Validate data against the job aid schema.
@@ -529,11 +315,8 @@ def validate_job_aid_data(data: Dict[str, Any]) -> bool:
     Raises:
         ValidationError: If the data does not conform to the schema
     """
-    try:
-        validate(instance=data, schema=DIGITAL_COMPONENT_ANALYSIS_SCHEMA)
-        return True
-    except ValidationError:
-        raise
+    _validate(*_job_aid_validators(), data)
+    return True
 
 
 def validate_findings_data(data: Dict[str, Any]) -> bool:
@@ -549,11 +332,200 @@ def validate_findings_data(data: Dict[str, Any]) -> bool:
     Raises:
         ValidationError: If the data does not conform to the schema
     """
+    _validate(*_findings_validators(), data)
+    return True
+
+
+def is_valid_job_aid_data(data: Dict[str, Any]) -> bool:
+    """
+    Check whether data conforms to the job aid schema.
+    
+    Cheaper than validate_job_aid_data when only a yes/no answer is needed,
+    as no ValidationError is built for invalid data.
+    
+    Args:
+        data: The data to check
+        
+    Returns:
+        bool: True if the data is valid, False otherwise
+    """
+    return _is_valid(*_job_aid_validators(), data)
+
+
+def is_valid_findings_data(data: Dict[str, Any]) -> bool:
+    """
+    Check whether data conforms to the findings output schema.
+    
+    Cheaper than validate_findings_data when only a yes/no answer is needed,
+    as no ValidationError is built for invalid data.
+    
+    Args:
+        data: The data to check
+        
+    Returns:
+        bool: True if the data is valid, False otherwise
+    """
+    return _is_valid(*_findings_validators(), data)
+
+
+def _resolve_ref(schema: Dict[str, Any], ref: str) -> Any:
+    """
+    Follow a local $ref such as "#/$defs/note" or "#/definitions/note".
+    
+    The fragment is walked as a JSON pointer from the schema root, so any
+    location works, not only $defs.
+    
+    Raises:
+        ValueError: If the ref points outside the schema document
+        LookupError: If the pointer does not resolve
+    """
+    if not ref.startswith("#"):
+        raise ValueError(f"Only local $ref pointers are supported, got {ref!r}")
+    
+    node: Any = schema
+    pointer = unquote(ref[1:])
+    if pointer:
+        for token in pointer.split("/")[1:]:
+            token = token.replace("~1", "/").replace("~0", "~")
+            node = node[int(token)] if isinstance(node, list) else node[token]
+    return node
+
+
+# Keywords holding shared subschemas, dropped once their refs are inlined
+_DEFINITIONS_KEYWORDS = ("$defs", "definitions")
+
+
+def _inline_refs(schema: Dict[str, Any], node: Any) -> Any:
+    """Copy a schema node with every local $ref replaced by its target."""
+    if isinstance(node, list):
+        return [_inline_refs(schema, item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    
+    ref = node.get("$ref")
+    if isinstance(ref, str):
+        return _inline_refs(schema, _resolve_ref(schema, ref))
+    return {key: _inline_refs(schema, value) for key, value in node.items()}
+
+
+def inline_schema_refs(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get a self-contained copy of a schema with its $ref pointers expanded.
+    
+    Used for prompt text, where the model cannot follow pointers; the stored
+    schema keeps its shared definitions.
+    
+    Args:
+        schema: The JSON schema
+        
+    Returns:
+        Dict[str, Any]: The schema with refs inlined and without $defs/definitions
+        
+    Raises:
+        ValueError: If a $ref cannot be resolved or refers back to itself
+    """
+    if not isinstance(schema, dict):
+        return schema
+    
+    top_level = {key: value for key, value in schema.items() if key not in _DEFINITIONS_KEYWORDS}
     try:
-        validate(instance=data, schema=FINDINGS_OUTPUT_SCHEMA)
-        return True
-    except ValidationError:
-        raise
+        return _inline_refs(schema, top_level)
+    except (LookupError, TypeError, ValueError, RecursionError) as e:
+        raise ValueError(f"Cannot inline the schema refs: {e}") from e
+
+
+def _build_empty(schema: Dict[str, Any], node: Any) -> Any:
+    """
+    Build the empty instance for a schema node in a single walk.
+    
+    Nodes with a "default" use it; objects recurse into their properties and
+    arrays start empty. Other scalars are left out, since an empty string
+    would not satisfy an assessment enum, as are boolean subschemas.
+    """
+    if not isinstance(node, dict):
+        return None
+    
+    if "default" in node:
+        return copy.deepcopy(node["default"])
+    
+    ref = node.get("$ref")
+    if isinstance(ref, str):
+        return _build_empty(schema, _resolve_ref(schema, ref))
+    
+    node_type = node.get("type")
+    if node_type == "object":
+        empty = {}
+        properties = node.get("properties", {})
+        if isinstance(properties, dict):
+            for name, child in properties.items():
+                value = _build_empty(schema, child)
+                if value is not None:
+                    empty[name] = value
+        return empty
+    if node_type == "array":
+        return []
+    return None
+
+
+def _build_empty_job_aid(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the empty job aid described by a schema.
+    
+    Args:
+        schema: The job aid schema
+        
+    Returns:
+        Dict[str, Any]: The empty job aid structure
+        
+    Raises:
+        ValueError: If the schema does not describe a JSON object or has a
+            $ref that cannot be resolved
+    """
+    try:
+        empty = _build_empty(schema, schema)
+    except (LookupError, TypeError, ValueError, RecursionError) as e:
+        raise ValueError(f"Cannot build an empty job aid from the schema: {e}") from e
+    
+    if not isinstance(empty, dict):
+        raise ValueError("The job aid schema must describe a JSON object")
+    return empty
+
+
+def check_job_aid_schema(schema: Dict[str, Any]) -> None:
+    """
+    Check that a schema can replace the job aid schema file.
+    
+    Runs the metaschema check and the same processing this module applies to
+    the file, so a saved schema cannot stop the package from loading.
+    
+    Args:
+        schema: The candidate job aid schema
+        
+    Raises:
+        ValueError: If the schema is invalid or cannot be processed
+    """
+    from jsonschema.exceptions import SchemaError
+    from jsonschema.validators import validator_for
+    
+    try:
+        validator_for(schema).check_schema(schema)
+    except SchemaError as e:
+        raise ValueError(f"Invalid JSON schema: {e.message}") from e
+    
+    _build_empty_job_aid(schema)
+    inline_schema_refs(schema)
+    key_for(schema)
+
+
+@lru_cache(maxsize=1)
+def _empty_job_aid() -> Dict[str, Any]:
+    """
+    Build the empty job aid from the schema on first use.
+    
+    Deferred from import so a schema the walk cannot handle fails the callers
+    that need the structure rather than every importer of this module.
+    """
+    return _build_empty_job_aid(DIGITAL_COMPONENT_ANALYSIS_SCHEMA)
 
 
 def create_empty_job_aid() -> Dict[str, Any]:
@@ -562,61 +534,11 @@ def create_empty_job_aid() -> Dict[str, Any]:
     
     Returns:
         Dict[str, Any]: An empty job aid structure
+        
+    Raises:
+        ValueError: If the empty structure cannot be built from the schema
     """
-    return {
-        "digital_component_analysis": {
-            "instructions": "Complete all sections of this job aid to assess the digital component.",
-            "component_specifications": {
-                "file_format_requirements": {},
-                "resolution_requirements": {},
-                "color_profile_requirements": {},
-                "naming_convention_requirements": {}
-            },
-            "component_metadata": {
-                "required_fields": [],
-                "optional_fields": [],
-                "validation_rules": {}
-            },
-            "component_qc": {
-                "visual_quality_checks": {
-                    "clarity": {},
-                    "lighting": {},
-                    "composition": {},
-                    "color_accuracy": {}
-                },
-                "technical_quality_checks": {
-                    "compression_artifacts": {},
-                    "noise_levels": {},
-                    "sharpness": {}
-                },
-                "compliance_checks": {
-                    "brand_guidelines": {},
-                    "legal_requirements": {},
-                    "accessibility_standards": {}
-                }
-            },
-            "component_linking": {
-                "relationship_requirements": {},
-                "dependency_checks": {}
-            },
-            "material_distribution_package_qc": {
-                "package_integrity_checks": {
-                    "completeness": {},
-                    "consistency": {}
-                },
-                "distribution_readiness_checks": {
-                    "channel_requirements": {},
-                    "delivery_specifications": {}
-                }
-            },
-            "overall_assessment": {
-                "status": "NEEDS_REVIEW",
-                "summary": "",
-                "critical_issues": [],
-                "recommendations": []
-            }
-        }
-    }
+    return copy.deepcopy(_empty_job_aid())
 
 
 def create_empty_findings_output(component_id: str = "", component_name: str = "") -> Dict[str, Any]:
@@ -640,6 +562,14 @@ def create_empty_findings_output(component_id: str = "", component_name: str = "
     }
 
 
+# Summary used when the job aid leaves overall_assessment.summary empty
+_DEFAULT_SUMMARIES = {
+    "PASS": "The digital component meets all compliance requirements.",
+    "FAIL": "The digital component has compliance issues that need to be addressed."
+}
+_DEFAULT_REVIEW_SUMMARY = "The digital component requires further review."
+
+
 def extract_assessment_summary(job_aid_data: Dict[str, Any]) -> str:
     """
     Extract an assessment summary from job aid data.
@@ -658,20 +588,13 @@ def extract_assessment_summary(job_aid_data: Dict[str, Any]) -> str:
         summary = overall.get("summary", "")
         critical_issues = overall.get("critical_issues", [])
         
-        if not summary:
-            if status == "PASS":
-                summary = "The digital component meets all compliance requirements."
-            elif status == "FAIL":
-                summary = "The digital component has compliance issues that need to be addressed."
-            else:
-                summary = "The digital component requires further review."
+        summary = summary or _DEFAULT_SUMMARIES.get(status, _DEFAULT_REVIEW_SUMMARY)
         
         result = f"Assessment Status: {status}\n\n{summary}"
         
         if critical_issues:
-            result += "\n\nCritical Issues:\n"
-            for i, issue in enumerate(critical_issues, 1):
-                result += f"{i}. {issue}\n"
+            issue_lines = [f"{i}. {issue}\n" for i, issue in enumerate(critical_issues, 1)]
+            result = "".join([result, "\n\nCritical Issues:\n", *issue_lines])
         
         return result
         
@@ -1,12 +1,18 @@
 # Services package for external integrations
+#
+# The client module pulls in the Google AI SDK, so it is only imported when
+# one of its names is first accessed (PEP 562).
 
-from .vertex_ai_client import (
-    GeminiClient,
-    GeminiAPIError,
-    MultimodalRequest,
-    AIResponse,
-    create_gemini_client
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .vertex_ai_client import (
+        GeminiClient,
+        GeminiAPIError,
+        MultimodalRequest,
+        AIResponse,
+        create_gemini_client
+    )
 
 __all__ = [
     'GeminiClient',
@@ -14,4 +20,12 @@ __all__ = [
     'MultimodalRequest',
     'AIResponse',
     'create_gemini_client'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import vertex_ai_client
+        globals().update({attr: getattr(vertex_ai_client, attr) for attr in __all__})
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
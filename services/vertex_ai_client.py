@@ -8,18 +8,26 @@ and retry logic.
 
 import asyncio
 import logging
-import time
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, Mapping, Sequence
 from dataclasses import dataclass
-import base64
+from functools import cache
+from types import MappingProxyType
 from io import BytesIO
 import json
+import random
 import re
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 import streamlit as st
 
+# Optional faster JSON parser; its JSONDecodeError subclasses json's
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +50,128 @@ class AIResponse:
     finish_reason: Optional[str] = None
 
 
+# Request defaults, shared read-only by every client and request
+_DEFAULT_GENERATION_CONFIG = MappingProxyType({
+    "max_output_tokens": 8192,
+    "temperature": 0.0,  # Set to 0 for deterministic responses
+    "top_p": 0.8,
+    "top_k": 40
+})
+
+_DEFAULT_SAFETY_SETTINGS = tuple(
+    MappingProxyType({"category": category, "threshold": "BLOCK_MEDIUM_AND_ABOVE"})
+    for category in (
+        "HARM_CATEGORY_HATE_SPEECH",
+        "HARM_CATEGORY_DANGEROUS_CONTENT",
+        "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        "HARM_CATEGORY_HARASSMENT",
+    )
+)
+
+# Errors worth retrying: rate limits, server-side failures and timeouts
+_RETRYABLE_ERRORS = (
+    google_exceptions.TooManyRequests,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.InternalServerError,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    asyncio.TimeoutError,
+    ConnectionError,
+)
+
+# JSON in a ```json fenced block, or failing that any brace-delimited span
+_JSON_BLOCK_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+
+class _JsonObjectScanner:
+    """
+    Find where the first JSON object in streamed text ends.
+    
+    Tracks brace depth incrementally, ignoring braces inside strings, and is
+    fed each chunk of text once as it arrives. Positions are indices into the
+    concatenation of everything fed so far.
+    """
+    
+    __slots__ = ('start', '_offset', '_depth', '_in_string', '_escaped')
+    
+    def __init__(self):
+        self.start = -1
+        self._offset = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+    
+    def restart(self, pos: int) -> None:
+        """Look for an object opening at or after pos; text from pos is fed next."""
+        self.__init__()
+        self._offset = pos
+    
+    def feed(self, chunk: str) -> int:
+        """
+        Scan the next chunk of text and return the index just past the end
+        of the first complete object, or -1 if none has closed yet.
+        """
+        base = self._offset
+        first = 0
+        if self.start == -1:
+            first = chunk.find('{')
+            if first == -1:
+                self._offset = base + len(chunk)
+                return -1
+            self.start = base + first
+        
+        for i in range(first, len(chunk)):
+            char = chunk[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == '{':
+                self._depth += 1
+            elif char == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._offset = base + i + 1
+                    return base + i + 1
+        
+        self._offset = base + len(chunk)
+        return -1
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@cache
+def _build_test_image() -> bytes:
+    """Build the health check image once; PIL is only imported here."""
+    try:
+        from PIL import Image as PILImage
+        
+        # Create a simple 100x100 white image
+        img = PILImage.new('RGB', (100, 100), color='white')
+        
+        # Convert to bytes
+        img_bytes = BytesIO()
+        img.save(img_bytes, format='JPEG')
+        
+        return img_bytes.getvalue()
+        
+    except Exception:
+        # Fallback: return a minimal JPEG header (won't work but won't crash)
+        return b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x01\x00H\x00H\x00\x00\xff\xd9'
+
+
 class GeminiAPIError(Exception):
     """Custom exception for Gemini API related errors"""
     pass
@@ -55,11 +185,41 @@ class GeminiClient:
     retry logic with exponential backoff, and response parsing.
     """
     
-    def __init__(self):
-        """Initialize the Gemini API client."""
+    def __init__(self, max_retries: int = 3, base_delay: float = 1.0,
+                 max_delay: float = 30.0, jitter: float = 0.5,
+                 max_concurrent: int = 8, request_timeout: Optional[float] = 120.0,
+                 total_timeout: Optional[float] = 300.0):
+        """
+        Initialize the Gemini API client.
+        
+        Args:
+            max_retries: Default maximum number of retry attempts per request
+            base_delay: Backoff delay in seconds before the first retry
+            max_delay: Upper bound in seconds for any single backoff delay
+            jitter: Maximum random fraction added to each backoff delay
+            max_concurrent: Maximum number of API calls in flight at once
+            request_timeout: Seconds allowed for each attempt, or None for no limit
+            total_timeout: Seconds allowed for a request including all retries
+                and backoff, or None for no limit
+        """
         self.model_name = "gemini-2.0-flash-exp"
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_concurrent = max_concurrent
+        self.request_timeout = request_timeout
+        self.total_timeout = total_timeout
         self._model: Optional[genai.GenerativeModel] = None
         self._initialized = False
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Defaults are the same for every request, so build them once
+        self._default_generation_config = self._get_default_generation_config()
+        self._default_gemini_safety_settings = self._translate_safety_settings(
+            self._get_default_safety_settings()
+        )
     
     async def initialize_client(self) -> None:
         """
@@ -78,7 +238,11 @@ class GeminiClient:
             
             api_key = st.secrets["gemini_api_key"]
             
-            # Configure the API
+            # Configure the API. This also resets the SDK's cached service
+            # clients, so each client (one per workflow run, each run in its own
+            # event loop) gets a fresh gRPC channel bound to the current loop.
+            # All requests made through this client share that channel, as
+            # HTTP/2 streams over a single TLS connection.
             genai.configure(api_key=api_key)
             
             # Initialize the generative model
@@ -88,7 +252,7 @@ class GeminiClient:
             )
             
             self._initialized = True
-            logger.info(f"Successfully initialized Gemini API client with model: {self.model_name}")
+            logger.info("Successfully initialized Gemini API client with model: %s", self.model_name)
             
         except Exception as e:
             error_msg = f"Failed to initialize Gemini API client: {str(e)}"
@@ -111,80 +275,124 @@ class GeminiClient:
         Returns:
             Dict: Image data for the request
         """
-        try:
-            # Convert bytes to base64 for Gemini API
-            image_b64 = base64.b64encode(image_bytes).decode('utf-8')
-            return {
-                "mime_type": mime_type,
-                "data": image_b64
-            }
-            
-        except Exception as e:
-            error_msg = f"Failed to create image data: {str(e)}"
-            logger.error(error_msg)
-            raise GeminiAPIError(error_msg)
-    
-    def _get_default_generation_config(self) -> Dict[str, Any]:
-        """Get default generation configuration"""
+        # Raw bytes go straight into the protobuf Blob; a base64 string would
+        # only be decoded back to bytes by the SDK
         return {
-            "max_output_tokens": 8192,
-            "temperature": 0.0,  # Set to 0 for deterministic responses
-            "top_p": 0.8,
-            "top_k": 40
+            "mime_type": mime_type,
+            "data": image_bytes
         }
     
-    def _get_default_safety_settings(self) -> List[Dict[str, Any]]:
+    def _get_default_generation_config(self) -> Mapping[str, Any]:
+        """Get default generation configuration"""
+        return _DEFAULT_GENERATION_CONFIG
+    
+    def _get_default_safety_settings(self) -> Tuple[Mapping[str, Any], ...]:
         """Get default safety settings"""
-        return [
-            {
-                "category": "HARM_CATEGORY_HATE_SPEECH",
-                "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-            },
-            {
-                "category": "HARM_CATEGORY_DANGEROUS_CONTENT", 
-                "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-            },
-            {
-                "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-            },
+        return _DEFAULT_SAFETY_SETTINGS
+    
+    def _request_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore that caps concurrent API calls.
+        
+        A semaphore belongs to one event loop, and Streamlit runs each workflow
+        in a fresh loop, so a new one is created whenever the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Get the wait before retrying after a failed attempt.
+        
+        The exponential delay is spread by random jitter so concurrent requests
+        that failed together (e.g. on a rate limit) don't all retry together.
+        """
+        delay = self.base_delay * (2 ** attempt) * (1 + random.random() * self.jitter)
+        return min(self.max_delay, delay)
+    
+    def _request_deadline(self, loop: asyncio.AbstractEventLoop) -> Optional[float]:
+        """Get the loop time by which a request and its retries must finish."""
+        if self.total_timeout is None:
+            return None
+        return loop.time() + self.total_timeout
+    
+    def _attempt_timeout(self, loop: asyncio.AbstractEventLoop,
+                         deadline: Optional[float]) -> Optional[float]:
+        """
+        Get the seconds allowed for the next attempt.
+        
+        This is the per-attempt limit, capped by the time left before the
+        overall deadline.
+        
+        Raises:
+            GeminiAPIError: If the overall deadline has already passed
+        """
+        if deadline is None:
+            return self.request_timeout
+        
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            error_msg = f"Request timed out after {self.total_timeout}s"
+            logger.error(error_msg)
+            raise GeminiAPIError(error_msg)
+        return remaining if self.request_timeout is None else min(self.request_timeout, remaining)
+    
+    def _translate_safety_settings(self, safety_settings: Sequence[Mapping[str, Any]]) -> Dict[Any, Any]:
+        """Convert safety settings to the Gemini enum mapping, skipping unknown names."""
+        gemini_safety_settings = {}
+        for setting in safety_settings:
+            category = getattr(HarmCategory, setting["category"], None)
+            threshold = getattr(HarmBlockThreshold, setting["threshold"], None)
+            if category and threshold:
+                gemini_safety_settings[category] = threshold
+        return gemini_safety_settings
+    
+    def _build_request_payload(
+        self,
+        request: MultimodalRequest
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[Any, Any]]:
+        """Build the contents, generation config and safety settings for a request."""
+        image_data = self._create_image_data(request.image_bytes, request.mime_type)
+        generation_config = request.generation_config or self._default_generation_config
+        if request.safety_settings:
+            gemini_safety_settings = self._translate_safety_settings(request.safety_settings)
+        else:
+            gemini_safety_settings = self._default_gemini_safety_settings
+        
+        # Create the content parts in the correct format
+        contents = [
             {
-                "category": "HARM_CATEGORY_HARASSMENT",
-                "threshold": "BLOCK_MEDIUM_AND_ABOVE"
+                "parts": [
+                    {
+                        "inline_data": image_data
+                    },
+                    {
+                        "text": request.text_prompt
+                    }
+                ]
             }
         ]
+        
+        return contents, generation_config, gemini_safety_settings
     
     def _create_test_image(self) -> bytes:
         """Create a simple test image for health checks"""
-        try:
-            from PIL import Image as PILImage
-            import io
-            
-            # Create a simple 100x100 white image
-            img = PILImage.new('RGB', (100, 100), color='white')
-            
-            # Convert to bytes
-            img_bytes = io.BytesIO()
-            img.save(img_bytes, format='JPEG')
-            img_bytes.seek(0)
-            
-            return img_bytes.getvalue()
-            
-        except Exception:
-            # Fallback: return a minimal JPEG header (won't work but won't crash)
-            return b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x01\x00H\x00H\x00\x00\xff\xd9'
+        return _build_test_image()
     
     async def process_multimodal_request(
         self,
         request: MultimodalRequest,
-        max_retries: int = 3
+        max_retries: Optional[int] = None
     ) -> AIResponse:
         """
         Process a multimodal request (image + text) with retry logic.
         
         Args:
             request: The multimodal request to process
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of retry attempts, defaults to the client's
             
         Returns:
             AIResponse: The processed response from the AI model
@@ -194,49 +402,41 @@ class GeminiClient:
         """
         self._ensure_initialized()
         
+        if max_retries is None:
+            max_retries = self.max_retries
+        
+        # Build the payload once; every attempt sends the same request
+        contents, generation_config, gemini_safety_settings = self._build_request_payload(request)
+        
+        loop = asyncio.get_running_loop()
+        deadline = self._request_deadline(loop)
+        
         for attempt in range(max_retries + 1):
+            attempt_timeout = self._attempt_timeout(loop, deadline)
+            
             try:
-                # Create image data
-                image_data = self._create_image_data(request.image_bytes, request.mime_type)
-                
-                # Prepare generation config
-                generation_config = request.generation_config or self._get_default_generation_config()
-                safety_settings = request.safety_settings or self._get_default_safety_settings()
-                
-                # Convert safety settings to Gemini format
-                gemini_safety_settings = {}
-                for setting in safety_settings:
-                    category = getattr(HarmCategory, setting["category"], None)
-                    threshold = getattr(HarmBlockThreshold, setting["threshold"], None)
-                    if category and threshold:
-                        gemini_safety_settings[category] = threshold
-                
-                # Create the content parts in the correct format
-                contents = [
-                    {
-                        "parts": [
-                            {
-                                "inline_data": {
-                                    "mime_type": request.mime_type,
-                                    "data": base64.b64encode(request.image_bytes).decode('utf-8')
-                                }
-                            },
-                            {
-                                "text": request.text_prompt
-                            }
-                        ]
-                    }
-                ]
-                
                 # Generate response
-                logger.info(f"Sending multimodal request to {self.model_name} (attempt {attempt + 1})")
+                logger.info("Sending multimodal request to %s (attempt %d)", self.model_name, attempt + 1)
                 
-                response = await asyncio.to_thread(
-                    self._model.generate_content,
-                    contents,
-                    generation_config=generation_config,
-                    safety_settings=gemini_safety_settings
-                )
+                # Prefer the SDK's native async call; older SDKs only have the
+                # blocking one, which is run in a worker thread instead. A timed
+                # out thread is abandoned rather than stopped.
+                generate_async = getattr(self._model, "generate_content_async", None)
+                async with self._request_semaphore():
+                    if generate_async is not None:
+                        call = generate_async(
+                            contents,
+                            generation_config=generation_config,
+                            safety_settings=gemini_safety_settings
+                        )
+                    else:
+                        call = asyncio.to_thread(
+                            self._model.generate_content,
+                            contents,
+                            generation_config=generation_config,
+                            safety_settings=gemini_safety_settings
+                        )
+                    response = await asyncio.wait_for(call, timeout=attempt_timeout)
                 
                 # Parse response
                 if not response.text:
@@ -264,27 +464,182 @@ class GeminiClient:
                 logger.error(error_msg)
                 raise GeminiAPIError(error_msg)
                 
-            except Exception as e:
-                # Check if it's a response stopped exception by string matching
-                if "response stopped" in str(e).lower() or "stopped" in str(e).lower():
-                    error_msg = f"Response stopped: {str(e)}"
-                    logger.error(error_msg)
-                    raise GeminiAPIError(error_msg)
-                
-                # Other errors - retry with exponential backoff
+            except _RETRYABLE_ERRORS as e:
+                # Transient errors - retry with exponential backoff
                 if attempt < max_retries:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Request failed, waiting {wait_time}s before retry {attempt + 1}: {str(e)}")
+                    wait_time = self._backoff_delay(attempt)
+                    if deadline is not None and loop.time() + wait_time >= deadline:
+                        error_msg = f"Request timed out after {self.total_timeout}s: {str(e) or type(e).__name__}"
+                        logger.error(error_msg)
+                        raise GeminiAPIError(error_msg)
+                    logger.warning("Request failed, waiting %.1fs before retry %d: %s", wait_time, attempt + 1, e)
                     await asyncio.sleep(wait_time)
                     continue
                 else:
                     error_msg = f"Request failed after {max_retries} retries: {str(e)}"
                     logger.error(error_msg)
                     raise GeminiAPIError(error_msg)
+            
+            except GeminiAPIError:
+                raise
+            
+            except Exception as e:
+                # Anything else would fail the same way again - don't retry
+                error_msg = f"Request failed: {str(e)}"
+                logger.error(error_msg)
+                raise GeminiAPIError(error_msg)
         
         # This should never be reached, but just in case
         raise GeminiAPIError("Unexpected error in retry logic")
     
+    async def _stream_chunks(self, contents: List[Any], generation_config: Mapping[str, Any],
+                             safety_settings: Dict[Any, Any]):
+        """
+        Yield response chunks from a streaming generate call.
+        
+        Uses the SDK's native async stream when available; otherwise the
+        blocking stream is read in a worker thread one chunk at a time. The
+        SDK's iterator is closed when the consumer stops early.
+        """
+        generate_async = getattr(self._model, "generate_content_async", None)
+        if generate_async is not None:
+            response = await generate_async(
+                contents,
+                generation_config=generation_config,
+                safety_settings=safety_settings,
+                stream=True
+            )
+            chunks = response.__aiter__()
+            try:
+                async for chunk in chunks:
+                    yield chunk
+            finally:
+                aclose = getattr(chunks, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            return
+        
+        response = await asyncio.to_thread(
+            self._model.generate_content,
+            contents,
+            generation_config=generation_config,
+            safety_settings=safety_settings,
+            stream=True
+        )
+        chunks = iter(response)
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except ValueError:
+                    # Still running in an abandoned worker thread
+                    pass
+    
+    async def _read_stream(self, contents: List[Any], generation_config: Mapping[str, Any],
+                           safety_settings: Dict[Any, Any]) -> Tuple[Optional[Any], str]:
+        """
+        Read a streamed response up to the end of its first JSON object.
+        
+        Returns:
+            Tuple of the decoded object, or None if the stream ended without
+            one, and the text received
+        """
+        parts: List[str] = []
+        scanner = _JsonObjectScanner()
+        chunks = self._stream_chunks(contents, generation_config, safety_settings)
+        
+        try:
+            async for chunk in chunks:
+                try:
+                    chunk_text = chunk.text
+                except ValueError:
+                    # Chunks without text parts (e.g. only a finish reason)
+                    continue
+                
+                parts.append(chunk_text)
+                end = scanner.feed(chunk_text)
+                while end != -1:
+                    # Joined only when an object may have closed
+                    text = "".join(parts)
+                    try:
+                        parsed_data, _ = _JSON_DECODER.raw_decode(text, scanner.start)
+                        return parsed_data, text
+                    except ValueError:
+                        # Braces in prose before the JSON; look further on
+                        pos = scanner.start + 1
+                        scanner.restart(pos)
+                        end = scanner.feed(text[pos:])
+        finally:
+            await chunks.aclose()
+        
+        return None, "".join(parts)
+    
+    async def process_multimodal_request_stream(self, request: MultimodalRequest) -> Dict[str, Any]:
+        """
+        Process a multimodal request as a stream and parse its structured output.
+        
+        Text is scanned as it arrives and the stream is abandoned as soon as the
+        first complete JSON object has been received, so trailing prose is
+        never waited for. Streams are not retried, as a partial response
+        cannot be resumed.
+        
+        Args:
+            request: The multimodal request to process
+            
+        Returns:
+            Dict[str, Any]: The first JSON object in the response, or the
+            result of parse_structured_response if none could be decoded
+            
+        Raises:
+            GeminiAPIError: If the request fails or does not finish in time
+        """
+        self._ensure_initialized()
+        
+        contents, generation_config, gemini_safety_settings = self._build_request_payload(request)
+        
+        # A stream is a single attempt, bounded like one attempt of
+        # process_multimodal_request; timing out cancels the read and closes
+        # the stream.
+        loop = asyncio.get_running_loop()
+        timeout = self._attempt_timeout(loop, self._request_deadline(loop))
+        
+        try:
+            async with self._request_semaphore():
+                parsed_data, text = await asyncio.wait_for(
+                    self._read_stream(contents, generation_config, gemini_safety_settings),
+                    timeout=timeout
+                )
+        
+        except genai.types.BlockedPromptException as e:
+            error_msg = f"Content blocked by safety filters: {str(e)}"
+            logger.error(error_msg)
+            raise GeminiAPIError(error_msg)
+        
+        except asyncio.TimeoutError:
+            error_msg = f"Streaming request timed out after {timeout}s"
+            logger.error(error_msg)
+            raise GeminiAPIError(error_msg)
+        
+        except Exception as e:
+            error_msg = f"Streaming request failed: {str(e)}"
+            logger.error(error_msg)
+            raise GeminiAPIError(error_msg)
+        
+        if parsed_data is not None:
+            return parsed_data
+        
+        if not text:
+            raise GeminiAPIError("Empty response from AI model")
+        
+        return self.parse_structured_response(AIResponse(text=text))
+    
     def parse_structured_response(self, response: AIResponse) -> Dict[str, Any]:
         """
         Parse structured response from AI model.
@@ -303,24 +658,31 @@ class GeminiClient:
             text = response.text.strip()
             
             # Look for JSON blocks in markdown format
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', text, re.DOTALL)
+            json_match = _JSON_BLOCK_RE.search(text)
             if json_match:
                 json_str = json_match.group(1)
             else:
                 # Look for JSON objects directly
-                json_match = re.search(r'\{.*\}', text, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                else:
+                start = text.find('{')
+                if start == -1:
                     # If no JSON found, return the text as-is
                     return {"text": text}
+                
+                # Decode the first complete object in place; this respects
+                # braces inside strings and ignores any text after the object
+                try:
+                    parsed_data, _ = _JSON_DECODER.raw_decode(text, start)
+                    return parsed_data
+                except ValueError:
+                    json_match = _JSON_OBJECT_RE.search(text, start)
+                    json_str = json_match.group(0) if json_match else text[start:]
             
             # Parse the JSON
-            parsed_data = json.loads(json_str)
+            parsed_data = _json_loads(json_str)
             return parsed_data
             
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse JSON from response: {str(e)}")
+            logger.warning("Failed to parse JSON from response: %s", e)
             # Return the raw text if JSON parsing fails
             return {"text": response.text}
         
@@ -353,7 +715,7 @@ class GeminiClient:
             return bool(response.text)
             
         except Exception as e:
-            logger.error(f"Health check failed: {str(e)}")
+            logger.error("Health check failed: %s", e)
             return False
 
 
@@ -80,42 +80,43 @@ def test_component_metadata_extraction():
     # Test conversion
     converted_metadata = convert_component_metadata_to_standard_format(component_data, mock_embedded_metadata)
     
+    converted_json = json.dumps(converted_metadata, indent=2)
+    
     print("✅ Conversion successful!")
-    print(f"📏 Generated JSON length: {len(json.dumps(converted_metadata, indent=2))} characters")
+    print(f"📏 Generated JSON length: {len(converted_json)} characters")
     
     # Verify key fields
-    print("\n🔍 Verification of converted fields:")
-    print(f"  • Component ID: {converted_metadata.get('component_id')}")
-    print(f"  • Component Name: {converted_metadata.get('component_name')}")
-    print(f"  • Description: {converted_metadata.get('description')[:50]}...")
-    print(f"  • Format: {converted_metadata['file_specifications'].get('format')}")
-    print(f"  • Resolution: {converted_metadata['file_specifications'].get('resolution')}")
-    print(f"  • Color Profile: {converted_metadata['file_specifications'].get('color_profile')}")
-    
-    # Check usage rights
+    file_specs = converted_metadata['file_specifications']
     usage_rights = converted_metadata.get('usage_rights', {})
-    print(f"  • Usage Rights:")
-    print(f"    - Commercial Use: {usage_rights.get('commercial_use')}")
-    print(f"    - Editorial Use: {usage_rights.get('editorial_use')}")
-    print(f"    - Restrictions: {usage_rights.get('restrictions')}")
-    
-    # Check geographic restrictions
     geo_restrictions = converted_metadata.get('geographic_restrictions', [])
-    print(f"  • Geographic Restrictions: {geo_restrictions}")
+    lines = [
+        "\n🔍 Verification of converted fields:",
+        f"  • Component ID: {converted_metadata.get('component_id')}",
+        f"  • Component Name: {converted_metadata.get('component_name')}",
+        f"  • Description: {converted_metadata.get('description')[:50]}...",
+        f"  • Format: {file_specs.get('format')}",
+        f"  • Resolution: {file_specs.get('resolution')}",
+        f"  • Color Profile: {file_specs.get('color_profile')}",
+        "  • Usage Rights:",
+        f"    - Commercial Use: {usage_rights.get('commercial_use')}",
+        f"    - Editorial Use: {usage_rights.get('editorial_use')}",
+        f"    - Restrictions: {usage_rights.get('restrictions')}",
+        f"  • Geographic Restrictions: {geo_restrictions}",
+    ]
     
     # Check additional metadata
     additional_metadata = converted_metadata.get('additional_metadata', {})
     if additional_metadata:
-        print(f"  • Additional Metadata Fields: {len(additional_metadata)}")
-        for key, value in additional_metadata.items():
-            if isinstance(value, dict):
-                print(f"    - {key}: {json.dumps(value)}")
-            else:
-                print(f"    - {key}: {value}")
+        lines.append(f"  • Additional Metadata Fields: {len(additional_metadata)}")
+        lines.extend(
+            f"    - {key}: {json.dumps(value) if isinstance(value, dict) else value}"
+            for key, value in additional_metadata.items()
+        )
     
     # Show the complete converted JSON
-    print(f"\n📋 Complete Converted JSON:")
-    print(json.dumps(converted_metadata, indent=2))
+    lines.append("\n📋 Complete Converted JSON:")
+    lines.append(converted_json)
+    print("\n".join(lines))
     
     return converted_metadata
 
@@ -9,12 +9,102 @@ import os
 from PIL import Image, ExifTags
 from PIL.ExifTags import TAGS
 import io
+from types import MappingProxyType
 
 # Add the current directory to the path so we can import our modules
 sys.path.append('.')
 
 from utils.image_processing import extract_embedded_metadata, get_image_metadata
 from utils.metadata_handler import get_default_metadata_structure
+from app import create_metadata_from_exif
+
+try:
+    import piexif
+except ImportError:
+    piexif = None
+
+
+# Simulated embedded metadata, built once at import; create_metadata_from_exif
+# only reads it, so read-only views are safe to share across checks
+PROFESSIONAL_EXIF_METADATA = MappingProxyType({
+    "basic_info": {
+        "format": "JPEG",
+        "width": 1920,
+        "height": 1080,
+        "mode": "RGB"
+    },
+    "exif_data": {
+        "Make": "Canon",
+        "Model": "EOS R6",
+        "Artist": "Professional Photographer",
+        "Copyright": "© 2024 Studio Name",
+        "DateTime": "2024:01:15 10:30:45",
+        "DateTimeOriginal": "2024:01:15 10:30:45",
+        "ISO": 800,
+        "FNumber": 4.0,
+        "ExposureTime": "1/60",
+        "ColorSpace": "sRGB"
+    },
+    "has_exif": True,
+    "dam_relevant": {
+        "camera_make": "Canon",
+        "camera_model": "EOS R6",
+        "photographer": "Professional Photographer",
+        "copyright": "© 2024 Studio Name",
+        "shoot_date": "2024-01-15T10:30:45Z",
+        "iso_speed": 800,
+        "aperture": 4.0,
+        "exposure_time": "1/60",
+        "color_space": "sRGB"
+    }
+})
+
+MINIMAL_EXIF_METADATA = MappingProxyType({
+    "basic_info": {
+        "format": "PNG",
+        "width": 640,
+        "height": 480
+    },
+    "exif_data": {},
+    "has_exif": False
+})
+
+WORKFLOW_EXIF_METADATA = MappingProxyType({
+    "basic_info": {
+        "format": "JPEG",
+        "width": 2048,
+        "height": 1365,
+        "mode": "RGB"
+    },
+    "has_exif": True,
+    "dam_relevant": {
+        "camera_make": "Sony",
+        "camera_model": "A7R IV",
+        "photographer": "Marketing Team",
+        "shoot_date": "2024-01-20T09:15:30Z",
+        "iso_speed": 200,
+        "aperture": 5.6,
+        "exposure_time": "1/250"
+    }
+})
+
+
+class MockFile:
+    """Minimal stand-in for a Streamlit UploadedFile backed by an open file."""
+
+    __slots__ = ('file_obj', 'name', 'size')
+
+    def __init__(self, file_obj, name, size):
+        self.file_obj = file_obj
+        self.name = name
+        self.size = size
+
+    def read(self, size=-1):
+        return self.file_obj.read(size)
+
+    def seek(self, pos):
+        return self.file_obj.seek(pos)
+
 
 def create_test_image_with_exif():
     """Create a test image with EXIF data for testing."""
@@ -43,27 +133,23 @@ def create_test_image_with_exif():
         "thumbnail": None
     }
     
-    try:
-        from PIL.ExifTags import TAGS
-        import piexif
-        
-        # Convert to bytes
-        exif_bytes = piexif.dump(exif_dict)
-        
-        # Save image with EXIF
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='JPEG', exif=exif_bytes)
-        img_bytes.seek(0)
-        
-        print("✅ Test image with EXIF created successfully")
-        return img_bytes
-        
-    except ImportError:
+    if piexif is None:
         print("⚠️ piexif not available, creating image without EXIF")
         img_bytes = io.BytesIO()
         img.save(img_bytes, format='JPEG')
         img_bytes.seek(0)
         return img_bytes
+    
+    # Convert to bytes
+    exif_bytes = piexif.dump(exif_dict)
+    
+    # Save image with EXIF
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format='JPEG', exif=exif_bytes)
+    img_bytes.seek(0)
+    
+    print("✅ Test image with EXIF created successfully")
+    return img_bytes
 
 
 def test_file_details_display():
@@ -85,33 +171,20 @@ def test_file_details_display():
             try:
                 # Open and process image
                 with open(image_path, 'rb') as f:
-                    # Create mock uploaded file
-                    class MockFile:
-                        def __init__(self, file_obj, name):
-                            self.file_obj = file_obj
-                            self.name = name
-                            self.size = os.path.getsize(image_path)
-                        
-                        def read(self):
-                            return self.file_obj.read()
-                        
-                        def seek(self, pos):
-                            return self.file_obj.seek(pos)
-                    
-                    mock_file = MockFile(f, os.path.basename(image_path))
-                    
-                    # Open with PIL
-                    image = Image.open(image_path)
+                    mock_file = MockFile(f, os.path.basename(image_path), os.fstat(f.fileno()).st_size)
                     
                     # Extract metadata
                     embedded_metadata = extract_embedded_metadata(mock_file)
-                    
+
+                    # Dimensions and format were already read while extracting
+                    basic_info = embedded_metadata.get('basic_info', {})
+
                     # Test file details display logic
                     print(f"  ✅ Basic Info:")
                     print(f"    • Name: {mock_file.name}")
                     print(f"    • Size: {mock_file.size / (1024*1024):.2f} MB")
-                    print(f"    • Dimensions: {image.width} x {image.height}")
-                    print(f"    • Format: {image.format}")
+                    print(f"    • Dimensions: {basic_info.get('width', 'Unknown')} x {basic_info.get('height', 'Unknown')}")
+                    print(f"    • Format: {basic_info.get('format', 'Unknown')}")
                     
                     if embedded_metadata.get('has_exif'):
                         print(f"  📋 EXIF detected: Yes")
@@ -135,47 +208,10 @@ def test_metadata_auto_population():
     print("\n🔧 Testing Metadata Auto-Population")
     print("=" * 50)
     
-    # Test with simulated EXIF data
-    simulated_metadata = {
-        "basic_info": {
-            "format": "JPEG",
-            "width": 1920,
-            "height": 1080,
-            "mode": "RGB"
-        },
-        "exif_data": {
-            "Make": "Canon",
-            "Model": "EOS R6",
-            "Artist": "Professional Photographer",
-            "Copyright": "© 2024 Studio Name",
-            "DateTime": "2024:01:15 10:30:45",
-            "DateTimeOriginal": "2024:01:15 10:30:45",
-            "ISO": 800,
-            "FNumber": 4.0,
-            "ExposureTime": "1/60",
-            "ColorSpace": "sRGB"
-        },
-        "has_exif": True,
-        "dam_relevant": {
-            "camera_make": "Canon",
-            "camera_model": "EOS R6",
-            "photographer": "Professional Photographer",
-            "copyright": "© 2024 Studio Name",
-            "shoot_date": "2024-01-15T10:30:45Z",
-            "iso_speed": 800,
-            "aperture": 4.0,
-            "exposure_time": "1/60",
-            "color_space": "sRGB"
-        }
-    }
-    
-    # Import the function from app.py
-    from app import create_metadata_from_exif
-    
     print("📋 Testing with rich EXIF data...")
     
     # Test auto-population
-    auto_metadata = create_metadata_from_exif("professional_photo.jpg", simulated_metadata)
+    auto_metadata = create_metadata_from_exif("professional_photo.jpg", PROFESSIONAL_EXIF_METADATA)
     
     print("✅ Auto-population successful!")
     print(f"📏 Generated JSON length: {len(json.dumps(auto_metadata, indent=2))} characters")
@@ -197,17 +233,7 @@ def test_metadata_auto_population():
     # Test with minimal EXIF data
     print(f"\n📋 Testing with minimal EXIF data...")
     
-    minimal_metadata = {
-        "basic_info": {
-            "format": "PNG",
-            "width": 640,
-            "height": 480
-        },
-        "exif_data": {},
-        "has_exif": False
-    }
-    
-    minimal_auto = create_metadata_from_exif("simple_image.png", minimal_metadata)
+    minimal_auto = create_metadata_from_exif("simple_image.png", MINIMAL_EXIF_METADATA)
     print("✅ Minimal auto-population successful!")
     print(f"  • Component ID: {minimal_auto.get('component_id')}")
     print(f"  • Resolution: {minimal_auto['file_specifications'].get('resolution')}")
@@ -228,30 +254,9 @@ def test_json_auto_population_workflow():
     
     # Create test scenario
     test_filename = "marketing_photo.jpg"
-    test_metadata = {
-        "basic_info": {
-            "format": "JPEG",
-            "width": 2048,
-            "height": 1365,
-            "mode": "RGB"
-        },
-        "has_exif": True,
-        "dam_relevant": {
-            "camera_make": "Sony",
-            "camera_model": "A7R IV",
-            "photographer": "Marketing Team",
-            "shoot_date": "2024-01-20T09:15:30Z",
-            "iso_speed": 200,
-            "aperture": 5.6,
-            "exposure_time": "1/250"
-        }
-    }
-    
-    # Import function
-    from app import create_metadata_from_exif
     
     # Execute workflow
-    auto_populated_json = create_metadata_from_exif(test_filename, test_metadata)
+    auto_populated_json = create_metadata_from_exif(test_filename, WORKFLOW_EXIF_METADATA)
     json_string = json.dumps(auto_populated_json, indent=2)
     
     print(f"\n✅ Workflow completed successfully!")
@@ -263,8 +268,9 @@ def test_json_auto_population_workflow():
     
     # Show a preview of the JSON
     print(f"\n📋 JSON Preview (first 300 characters):")
+    preview = json_string[:300]
     print(f"```json")
-    print(json_string[:300] + "..." if len(json_string) > 300 else json_string)
+    print(preview + "..." if len(preview) < len(json_string) else preview)
     print(f"```")
 
 
@@ -68,10 +68,13 @@ def test_schema_serialization():
     print("=" * 50)
     
     try:
-        from schemas.job_aid import DIGITAL_COMPONENT_ANALYSIS_SCHEMA
+        from schemas.job_aid import (
+            DIGITAL_COMPONENT_ANALYSIS_SCHEMA,
+            DIGITAL_COMPONENT_ANALYSIS_SCHEMA_JSON
+        )
         
-        # Test JSON serialization
-        json_string = json.dumps(DIGITAL_COMPONENT_ANALYSIS_SCHEMA, indent=2)
+        # Test JSON serialization (the text the settings editor shows)
+        json_string = DIGITAL_COMPONENT_ANALYSIS_SCHEMA_JSON
         print(f"✅ Schema serialized to JSON ({len(json_string)} characters)")
         
         # Test JSON deserialization
@@ -161,15 +164,15 @@ def test_schema_structure():
                     "overall_assessment"
                 ]
                 
-                found_sections = []
+                missing_sections = set(expected_sections) - dca_props.keys()
                 for section in expected_sections:
-                    if section in dca_props:
-                        found_sections.append(section)
-                        print(f"  ✅ Found section: {section}")
-                    else:
+                    if section in missing_sections:
                         print(f"  ⚠️ Missing section: {section}")
+                    else:
+                        print(f"  ✅ Found section: {section}")
                 
-                print(f"✅ Found {len(found_sections)}/{len(expected_sections)} expected sections")
+                found_count = len(expected_sections) - len(missing_sections)
+                print(f"✅ Found {found_count}/{len(expected_sections)} expected sections")
                 
                 # Check component_specifications structure
                 if "component_specifications" in dca_props:
@@ -186,11 +189,12 @@ def test_schema_structure():
                             "naming_convention_requirements"
                         ]
                         
+                        missing_specs = set(spec_types) - specs_props.keys()
                         for spec_type in spec_types:
-                            if spec_type in specs_props:
-                                print(f"    ✅ Found spec: {spec_type}")
-                            else:
+                            if spec_type in missing_specs:
                                 print(f"    ⚠️ Missing spec: {spec_type}")
+                            else:
+                                print(f"    ✅ Found spec: {spec_type}")
             else:
                 print("❌ Digital component analysis missing properties")
                 return False
@@ -211,25 +215,30 @@ def test_file_permissions():
     print("\n🔧 Testing Schema File Permissions")
     print("=" * 50)
     
-    schema_file = 'schemas/job_aid.py'
-    
-    # Test read access
     try:
-        with open(schema_file, 'r') as f:
-            content = f.read()
-        print(f"✅ Can read {schema_file} ({len(content)} characters)")
+        import schemas.job_aid as job_aid_module
+        
+        # The schema lives in a JSON data file that the settings page rewrites
+        schema_file = job_aid_module.JOB_AID_SCHEMA_PATH
+        
+        # Test read access without re-reading the already-loaded file
+        if os.access(schema_file, os.R_OK):
+            print(f"✅ Can read {schema_file.name}")
+        else:
+            print(f"❌ Cannot read {schema_file.name}")
+            return False
         
-        # Check that the file contains the schema
-        if "DIGITAL_COMPONENT_ANALYSIS_SCHEMA" in content:
-            print("✅ Schema file contains DIGITAL_COMPONENT_ANALYSIS_SCHEMA")
+        # Check that the module exposes the schema
+        if hasattr(job_aid_module, "DIGITAL_COMPONENT_ANALYSIS_SCHEMA"):
+            print("✅ Schema module provides DIGITAL_COMPONENT_ANALYSIS_SCHEMA")
         else:
-            print("❌ Schema file missing DIGITAL_COMPONENT_ANALYSIS_SCHEMA")
+            print("❌ Schema module missing DIGITAL_COMPONENT_ANALYSIS_SCHEMA")
             return False
         
         return True
         
     except Exception as e:
-        print(f"❌ Cannot read {schema_file}: {str(e)}")
+        print(f"❌ Cannot access the job aid schema file: {str(e)}")
         return False
 
 
@@ -5,6 +5,7 @@ Test script to verify the settings interface functionality.
 
 import sys
 import os
+from pathlib import Path
 
 # Add the current directory to the path so we can import our modules
 sys.path.append('.')
@@ -120,47 +121,40 @@ def test_file_permissions():
         print(f"❌ Cannot read {prompts_file}: {str(e)}")
         return False
     
-    # Test write access (create a backup first)
+    # Probe write access without touching the file
+    if not os.access(prompts_file, os.W_OK):
+        print(f"⚠️ {prompts_file} is read-only, skipping write test")
+        return True
+    
+    print(f"✅ {prompts_file} is writable")
+    
+    # A real write modifies a tracked source file, so only do it on request
+    if not os.environ.get('RUN_DESTRUCTIVE_TESTS'):
+        print("ℹ️ Set RUN_DESTRUCTIVE_TESTS=1 to also append to and restore the file")
+        return True
+    
+    # Restored through the app's atomic writer, so an interrupted restore
+    # cannot leave a truncated templates module behind
+    from app import atomic_write_text
+    
+    # Test write access (keep the original in memory to restore it)
+    original = Path(prompts_file).read_text(encoding='utf-8')
     try:
-        backup_file = prompts_file + '.backup'
-        
-        # Create backup
-        with open(prompts_file, 'r') as src, open(backup_file, 'w') as dst:
-            dst.write(src.read())
-        
-        print(f"✅ Created backup: {backup_file}")
-        
         # Test write (just append a comment)
         with open(prompts_file, 'a') as f:
             f.write('\n# Test write access\n')
         
         print(f"✅ Can write to {prompts_file}")
         
-        # Restore from backup
-        with open(backup_file, 'r') as src, open(prompts_file, 'w') as dst:
-            dst.write(src.read())
-        
-        # Remove backup
-        os.remove(backup_file)
-        
-        print(f"✅ Restored original file and cleaned up backup")
-        
         return True
         
     except Exception as e:
         print(f"❌ Cannot write to {prompts_file}: {str(e)}")
-        
-        # Try to restore from backup if it exists
-        try:
-            if os.path.exists(backup_file):
-                with open(backup_file, 'r') as src, open(prompts_file, 'w') as dst:
-                    dst.write(src.read())
-                os.remove(backup_file)
-                print("✅ Restored from backup after error")
-        except:
-            pass
-        
         return False
+        
+    finally:
+        atomic_write_text(prompts_file, original)
+        print(f"✅ Restored original {prompts_file}")
 
 
 def main():
@@ -5,6 +5,9 @@ Test script to verify that small images (25x25 pixels) are now accepted.
 
 import sys
 import io
+import struct
+import zlib
+from functools import lru_cache
 from PIL import Image
 
 # Add the current directory to the path so we can import our modules
@@ -13,6 +16,56 @@ sys.path.append('.')
 from utils.validation_errors import ImageValidationError, ValidationResult
 from utils.error_handler import ErrorContext
 
+
+class MockFile(io.BytesIO):
+    """In-memory stand-in for a Streamlit UploadedFile."""
+
+    __slots__ = ('name', 'size')
+
+    def __init__(self, data, filename):
+        super().__init__(data)
+        self.name = filename
+        self.size = len(data)
+
+
+def _png_chunk(chunk_type, data):
+    """Frame a PNG chunk: length, type, data and CRC."""
+    return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+
+@lru_cache(maxsize=None)
+def _png_header(width, height):
+    """Build a header-only RGB PNG (signature, IHDR, IEND) for dimension-only checks.
+
+    validate_image_content only reads the size from the header, so there is
+    no pixel data to encode.
+    """
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + _png_chunk(b'IHDR', ihdr) + _png_chunk(b'IEND', b'')
+
+
+# Logo colours as raw RGBA pixels
+_LOGO_BLUE = bytes((0, 100, 200, 255))
+_LOGO_WHITE = bytes((255, 255, 255, 255))
+
+
+@lru_cache(maxsize=None)
+def _logo_png(width, height):
+    """Encode a striped RGBA logo once per size and return its PNG bytes."""
+    # Add some simple "logo" content: white diagonals where (x + y) % 10 == 0.
+    # Rows repeat with period 10, shifted by one pixel per row.
+    periods = [
+        b''.join(_LOGO_WHITE if x == (-y) % 10 else _LOGO_BLUE for x in range(10))
+        for y in range(10)
+    ]
+    repeats = width // 10 + 1
+    pixels = b''.join((periods[y % 10] * repeats)[:width * 4] for y in range(height))
+    
+    img_bytes = io.BytesIO()
+    Image.frombytes('RGBA', (width, height), pixels).save(img_bytes, format='PNG')
+    return img_bytes.getvalue()
+
+
 def test_small_image_validation():
     """Test that images as small as 25x25 pixels are now accepted."""
     
@@ -42,27 +95,8 @@ def test_small_image_validation():
         print(f"{i}. {description}")
         print(f"   Size: {width}x{height} pixels")
         
-        # Create test image
-        img = Image.new('RGB', (width, height), color='red')
-        
-        # Convert to bytes and create mock file
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='JPEG')
-        img_bytes.seek(0)
-        
-        class MockFile:
-            def __init__(self, bytes_io, filename):
-                self.bytes_io = bytes_io
-                self.name = filename
-                self.size = len(bytes_io.getvalue())
-            
-            def read(self):
-                return self.bytes_io.read()
-            
-            def seek(self, pos):
-                return self.bytes_io.seek(pos)
-        
-        mock_file = MockFile(img_bytes, f"test_{width}x{height}.jpg")
+        # Create test image and mock file
+        mock_file = MockFile(_png_header(width, height), f"test_{width}x{height}.png")
         
         # Test validation
         context = ErrorContext(operation="test", step="validation", component="size_test")
@@ -127,32 +161,7 @@ def test_user_scenario():
         print(f"\n📋 Testing {description} ({width}x{height}):")
         
         # Create PNG logo with transparency (typical for logos)
-        img = Image.new('RGBA', (width, height), color=(0, 100, 200, 255))
-        
-        # Add some simple "logo" content
-        for x in range(width):
-            for y in range(height):
-                if (x + y) % 10 == 0:  # Simple pattern
-                    img.putpixel((x, y), (255, 255, 255, 255))
-        
-        # Convert to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
-        
-        class MockFile:
-            def __init__(self, bytes_io, filename):
-                self.bytes_io = bytes_io
-                self.name = filename
-                self.size = len(bytes_io.getvalue())
-            
-            def read(self):
-                return self.bytes_io.read()
-            
-            def seek(self, pos):
-                return self.bytes_io.seek(pos)
-        
-        mock_file = MockFile(img_bytes, f"logo_{width}x{height}.png")
+        mock_file = MockFile(_logo_png(width, height), f"logo_{width}x{height}.png")
         
         # Test complete validation pipeline
         context = ErrorContext(operation="logo_upload", step="validation", component="user_test")
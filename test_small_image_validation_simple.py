@@ -8,7 +8,7 @@ import sys
 # Add the current directory to the path so we can import our modules
 sys.path.append('.')
 
-from utils.validation_errors import ImageValidationError
+from utils.validation_constants import MIN_WIDTH, MIN_HEIGHT, MAX_WIDTH, MAX_HEIGHT
 
 def test_minimum_size_constants():
     """Test that the minimum size constants are correctly updated."""
@@ -17,22 +17,22 @@ def test_minimum_size_constants():
     print("=" * 50)
     
     print(f"Current minimum dimensions:")
-    print(f"  • MIN_WIDTH: {ImageValidationError.MIN_WIDTH} pixels")
-    print(f"  • MIN_HEIGHT: {ImageValidationError.MIN_HEIGHT} pixels")
-    print(f"  • MAX_WIDTH: {ImageValidationError.MAX_WIDTH} pixels")
-    print(f"  • MAX_HEIGHT: {ImageValidationError.MAX_HEIGHT} pixels")
+    print(f"  • MIN_WIDTH: {MIN_WIDTH} pixels")
+    print(f"  • MIN_HEIGHT: {MIN_HEIGHT} pixels")
+    print(f"  • MAX_WIDTH: {MAX_WIDTH} pixels")
+    print(f"  • MAX_HEIGHT: {MAX_HEIGHT} pixels")
     
     # Verify the constants are set correctly
-    if ImageValidationError.MIN_WIDTH == 25:
+    if MIN_WIDTH == 25:
         print("✅ MIN_WIDTH correctly set to 25 pixels")
     else:
-        print(f"❌ MIN_WIDTH should be 25, but is {ImageValidationError.MIN_WIDTH}")
+        print(f"❌ MIN_WIDTH should be 25, but is {MIN_WIDTH}")
         return False
     
-    if ImageValidationError.MIN_HEIGHT == 25:
+    if MIN_HEIGHT == 25:
         print("✅ MIN_HEIGHT correctly set to 25 pixels")
     else:
-        print(f"❌ MIN_HEIGHT should be 25, but is {ImageValidationError.MIN_HEIGHT}")
+        print(f"❌ MIN_HEIGHT should be 25, but is {MIN_HEIGHT}")
         return False
     
     return True
@@ -61,10 +61,8 @@ def test_validation_logic():
     
     for width, height, should_pass, description in test_cases:
         # Simulate the validation logic from the actual code
-        passes_validation = (width >= ImageValidationError.MIN_WIDTH and 
-                           height >= ImageValidationError.MIN_HEIGHT and
-                           width <= ImageValidationError.MAX_WIDTH and 
-                           height <= ImageValidationError.MAX_HEIGHT)
+        passes_validation = (MIN_WIDTH <= width <= MAX_WIDTH and
+                             MIN_HEIGHT <= height <= MAX_HEIGHT)
         
         status = "✅ PASS" if passes_validation else "❌ FAIL"
         expected = "✅ EXPECTED" if passes_validation == should_pass else "❌ UNEXPECTED"
@@ -8,6 +8,35 @@ import json
 from workflow import Step3Processor
 from services import create_gemini_client
 
+# Elements the Step 3 prompt must contain
+PROMPT_KEY_ELEMENTS = (
+    "STRUCTURED JSON OUTPUT",
+    "HUMAN-READABLE REPORT",
+    "FORMAT YOUR RESPONSE EXACTLY AS FOLLOWS",
+    "component_id",
+    "check_status",
+    "DIGITAL ASSET COMPLIANCE ASSESSMENT REPORT"
+)
+
+# Elements the generated human-readable report must contain
+REPORT_ELEMENTS = (
+    "**DIGITAL ASSET COMPLIANCE ASSESSMENT REPORT**",
+    "**Component:** Test Product Image",
+    "**Component ID:** IMG_TEST_001",
+    "**Status:** FAILED",
+    "**Executive Summary:**",
+    "**Issues Detected:** 2",
+    "**Missing Information:** 1",
+    "**Recommendations:**",
+    "**Conclusion:**"
+)
+
+
+def _missing_elements(elements, text):
+    """Return the elements that do not appear in text."""
+    return [element for element in elements if element not in text]
+
+
 async def test_step3_improvements():
     """Test the improved Step 3 processor with sample data."""
     
@@ -87,19 +116,7 @@ async def test_step3_improvements():
         print(f"📏 Prompt length: {len(prompt)} characters")
         
         # Check if prompt contains key elements
-        key_elements = [
-            "STRUCTURED JSON OUTPUT",
-            "HUMAN-READABLE REPORT", 
-            "FORMAT YOUR RESPONSE EXACTLY AS FOLLOWS",
-            "component_id",
-            "check_status",
-            "DIGITAL ASSET COMPLIANCE ASSESSMENT REPORT"
-        ]
-        
-        missing_elements = []
-        for element in key_elements:
-            if element not in prompt:
-                missing_elements.append(element)
+        missing_elements = _missing_elements(PROMPT_KEY_ELEMENTS, prompt)
         
         if missing_elements:
             print(f"⚠️  Missing elements in prompt: {missing_elements}")
@@ -151,22 +168,7 @@ async def test_step3_improvements():
         print(f"📏 Report length: {len(report)} characters")
         
         # Check report content
-        report_elements = [
-            "**DIGITAL ASSET COMPLIANCE ASSESSMENT REPORT**",
-            "**Component:** Test Product Image",
-            "**Component ID:** IMG_TEST_001", 
-            "**Status:** FAILED",
-            "**Executive Summary:**",
-            "**Issues Detected:** 2",
-            "**Missing Information:** 1",
-            "**Recommendations:**",
-            "**Conclusion:**"
-        ]
-        
-        missing_report_elements = []
-        for element in report_elements:
-            if element not in report:
-                missing_report_elements.append(element)
+        missing_report_elements = _missing_elements(REPORT_ELEMENTS, report)
         
         if missing_report_elements:
             print(f"⚠️  Missing elements in report: {missing_report_elements}")
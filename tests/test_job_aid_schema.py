@@ -6,18 +6,31 @@ Tests the job aid schema validation functions and utilities.
 
 import pytest
 import json
+from unittest.mock import patch
 from jsonschema import ValidationError
 
 from schemas.job_aid import (
     DIGITAL_COMPONENT_ANALYSIS_SCHEMA,
+    DIGITAL_COMPONENT_ANALYSIS_SCHEMA_JSON,
     FINDINGS_OUTPUT_SCHEMA,
     get_job_aid_schema,
     get_findings_schema,
+    get_job_aid_schema_hash,
+    get_findings_schema_hash,
+    key_for,
+    inline_schema_refs,
+    get_validator_for,
     validate_job_aid_data,
     validate_findings_data,
+    is_valid_job_aid_data,
+    is_valid_findings_data,
+    check_job_aid_schema,
     create_empty_job_aid,
     create_empty_findings_output,
-    extract_assessment_summary
+    extract_assessment_summary,
+    _job_aid_validators,
+    _build_empty_job_aid,
+    _empty_job_aid
 )
 
 
@@ -31,6 +44,11 @@ class TestJobAidSchema:
         assert schema == DIGITAL_COMPONENT_ANALYSIS_SCHEMA
         assert "digital_component_analysis" in schema["properties"]
     
+    def test_job_aid_schema_json(self):
+        """Test that the shared schema JSON is the indented form of the schema"""
+        assert DIGITAL_COMPONENT_ANALYSIS_SCHEMA_JSON == json.dumps(DIGITAL_COMPONENT_ANALYSIS_SCHEMA, indent=2)
+        assert json.loads(DIGITAL_COMPONENT_ANALYSIS_SCHEMA_JSON) == DIGITAL_COMPONENT_ANALYSIS_SCHEMA
+    
     def test_get_findings_schema(self):
         """Test getting the findings schema"""
         schema = get_findings_schema()
@@ -39,6 +57,32 @@ class TestJobAidSchema:
         assert "component_id" in schema["properties"]
         assert "check_status" in schema["properties"]
     
+    def test_schema_hashes(self):
+        """Test that schema hashes are stable cache keys"""
+        job_aid_hash = get_job_aid_schema_hash()
+        
+        assert isinstance(job_aid_hash, str)
+        assert len(job_aid_hash) == 32
+        assert job_aid_hash == get_job_aid_schema_hash()
+        assert job_aid_hash != get_findings_schema_hash()
+        assert job_aid_hash == key_for(DIGITAL_COMPONENT_ANALYSIS_SCHEMA)
+    
+    def test_get_validator_for_equivalent_schemas(self):
+        """Test that equivalent schemas share one cached validator"""
+        schema = {"type": "object", "properties": {"name": {"type": "string"}}, "required": ["name"]}
+        reordered = json.loads(json.dumps(schema, sort_keys=True))
+        
+        assert key_for(schema) == key_for(reordered)
+        
+        validator = get_validator_for(schema)
+        assert get_validator_for(reordered) is validator
+        assert validator.is_valid({"name": "Product Image"})
+        assert not validator.is_valid({})
+        
+        # The cached validator keeps its own copy of the schema
+        schema["required"].append("id")
+        assert validator.is_valid({"name": "Product Image"})
+    
     def test_validate_job_aid_data_valid(self):
         """Test validating valid job aid data"""
         data = {
@@ -76,6 +120,16 @@ class TestJobAidSchema:
         with pytest.raises(ValidationError):
             validate_job_aid_data(data)
     
+    def test_validate_job_aid_data_without_fast_validator(self):
+        """Test validation falls back to jsonschema when no accelerator is available"""
+        validator, _ = _job_aid_validators()
+        
+        with patch('schemas.job_aid._job_aid_validators', return_value=(validator, None)):
+            assert validate_job_aid_data(create_empty_job_aid()) is True
+            
+            with pytest.raises(ValidationError):
+                validate_job_aid_data({"invalid_key": "value"})
+    
     def test_validate_findings_data_valid(self):
         """Test validating valid findings data"""
         data = {
@@ -111,6 +165,27 @@ class TestJobAidSchema:
         with pytest.raises(ValidationError):
             validate_findings_data(data)
     
+    def test_findings_data_rejects_unknown_keys(self):
+        """Test that the findings schema is closed to unknown keys"""
+        data = create_empty_findings_output("IMG_12345")
+        data["confidence"] = "high"
+        assert is_valid_findings_data(data) is False
+        
+        data = create_empty_findings_output("IMG_12345")
+        data["issues_detected"].append({"category": "Visual Quality", "description": "Blurry", "severity": "high"})
+        with pytest.raises(ValidationError):
+            validate_findings_data(data)
+    
+    def test_is_valid_job_aid_data(self):
+        """Test the boolean job aid check"""
+        assert is_valid_job_aid_data(create_empty_job_aid()) is True
+        assert is_valid_job_aid_data({"invalid_key": "value"}) is False
+    
+    def test_is_valid_findings_data(self):
+        """Test the boolean findings check"""
+        assert is_valid_findings_data(create_empty_findings_output("IMG_12345")) is True
+        assert is_valid_findings_data({"component_id": "IMG_12345"}) is False
+    
     def test_create_empty_job_aid(self):
         """Test creating an empty job aid structure"""
         job_aid = create_empty_job_aid()
@@ -127,6 +202,79 @@ class TestJobAidSchema:
         # Validate against schema
         assert validate_job_aid_data(job_aid) is True
     
+    def test_create_empty_job_aid_follows_schema(self):
+        """Test that the empty job aid is derived from the schema"""
+        job_aid = create_empty_job_aid()
+        schema_sections = DIGITAL_COMPONENT_ANALYSIS_SCHEMA["properties"]["digital_component_analysis"]["properties"]
+        
+        assert set(job_aid["digital_component_analysis"]) == set(schema_sections)
+        assert "assessment" not in job_aid["digital_component_analysis"]["component_qc"]
+        
+        # Each call returns an independent copy
+        job_aid["digital_component_analysis"]["overall_assessment"]["critical_issues"].append("Issue")
+        assert create_empty_job_aid()["digital_component_analysis"]["overall_assessment"]["critical_issues"] == []
+    
+    def test_build_empty_job_aid_resolves_definitions_refs(self):
+        """Test that $ref pointers into "definitions" are followed"""
+        schema = {
+            "type": "object",
+            "definitions": {"note": {"type": "object", "properties": {"tags": {"type": "array"}}}},
+            "properties": {
+                "note": {"$ref": "#/definitions/note"},
+                "flag": True
+            }
+        }
+        
+        assert _build_empty_job_aid(schema) == {"note": {"tags": []}}
+    
+    def test_build_empty_job_aid_rejects_unresolvable_ref(self):
+        """Test that a dangling $ref is reported as a ValueError"""
+        schema = {"type": "object", "properties": {"note": {"$ref": "#/$defs/missing"}}}
+        
+        with pytest.raises(ValueError):
+            _build_empty_job_aid(schema)
+    
+    def test_create_empty_job_aid_broken_schema(self):
+        """Test that an unusable schema is reported when the structure is needed"""
+        broken_schema = {"type": "object", "properties": {"note": {"$ref": "#/$defs/missing"}}}
+        
+        _empty_job_aid.cache_clear()
+        try:
+            with patch("schemas.job_aid.DIGITAL_COMPONENT_ANALYSIS_SCHEMA", broken_schema):
+                with pytest.raises(ValueError):
+                    create_empty_job_aid()
+        finally:
+            _empty_job_aid.cache_clear()
+    
+    def test_check_job_aid_schema(self):
+        """Test the checks run before a schema replaces job_aid.json"""
+        check_job_aid_schema(DIGITAL_COMPONENT_ANALYSIS_SCHEMA)
+        
+        with pytest.raises(ValueError, match="Invalid JSON schema"):
+            check_job_aid_schema({"type": 5})
+        with pytest.raises(ValueError):
+            check_job_aid_schema({"type": "object", "properties": {"note": {"$ref": "#/definitions/note"}}})
+        with pytest.raises(ValueError):
+            check_job_aid_schema(True)
+    
+    def test_inline_schema_refs(self):
+        """Test that refs are expanded in a copy and the stored schema is unchanged"""
+        inlined = inline_schema_refs(DIGITAL_COMPONENT_ANALYSIS_SCHEMA)
+        
+        assert "$ref" not in json.dumps(inlined)
+        assert "$defs" not in inlined
+        assert "$defs" in DIGITAL_COMPONENT_ANALYSIS_SCHEMA
+        
+        schema = {
+            "type": "object",
+            "definitions": {"note": {"type": "string"}},
+            "properties": {"note": {"$ref": "#/definitions/note"}}
+        }
+        assert inline_schema_refs(schema) == {"type": "object", "properties": {"note": {"type": "string"}}}
+        
+        with pytest.raises(ValueError):
+            inline_schema_refs({"type": "object", "properties": {"self": {"$ref": "#"}}})
+    
     def test_create_empty_findings_output(self):
         """Test creating an empty findings output structure"""
         findings = create_empty_findings_output("IMG_12345", "Product Image")
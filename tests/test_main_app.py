@@ -18,6 +18,7 @@ from app import (
     display_workflow_results,
     execute_workflow_analysis,
     display_instructions,
+    save_job_aid_schema,
     main
 )
 
@@ -801,6 +802,25 @@ class TestWorkflowExecutionFlow:
         
         assert incomplete_result["workflow_complete"] is False
         assert incomplete_result["error"] is None
+    
+    @patch('app.atomic_write_text')
+    def test_save_job_aid_schema_rejects_unusable_schema(self, mock_write):
+        """Test that a schema the package could not load is never written."""
+        with pytest.raises(ValueError):
+            save_job_aid_schema({"type": 5})
+        with pytest.raises(ValueError):
+            save_job_aid_schema({"type": "object", "properties": {"note": {"$ref": "#/$defs/missing"}}})
+        
+        mock_write.assert_not_called()
+    
+    @patch('app.atomic_write_text')
+    def test_save_job_aid_schema_writes_valid_schema(self, mock_write):
+        """Test that a usable schema is written to the schema file."""
+        schema = {"type": "object", "properties": {"status": {"type": "string", "default": "NEEDS_REVIEW"}}}
+        
+        assert save_job_aid_schema(schema) is True
+        mock_write.assert_called_once()
+        assert json.loads(mock_write.call_args.args[1]) == schema
 
 
 class TestApplicationFlow:
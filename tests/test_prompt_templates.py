@@ -18,6 +18,7 @@ from prompts.templates import (
     format_step3_prompt,
     get_system_instruction
 )
+from schemas.job_aid import DIGITAL_COMPONENT_ANALYSIS_SCHEMA, inline_schema_refs
 
 
 class TestPromptTemplates:
@@ -143,6 +144,22 @@ class TestPromptTemplates:
         # Check that metadata is included
         assert json.dumps(sample_metadata["component_id"]) in prompt
     
+    def test_format_step2_prompt_with_serialized_results(self, sample_job_aid_schema, sample_step1_results):
+        """Test that pre-serialized Step 1 results are used as-is"""
+        results_str = json.dumps(sample_step1_results, indent=2)
+        
+        prompt = format_step2_prompt(sample_job_aid_schema, results_str)
+        
+        assert prompt == format_step2_prompt(sample_job_aid_schema, sample_step1_results)
+    
+    def test_format_step2_prompt_inlines_schema_refs(self, sample_step1_results):
+        """Test that the job aid schema in the prompt has no $ref pointers"""
+        prompt = format_step2_prompt(DIGITAL_COMPONENT_ANALYSIS_SCHEMA, sample_step1_results)
+        
+        assert "$ref" not in prompt
+        assert "$defs" not in prompt
+        assert json.dumps(inline_schema_refs(DIGITAL_COMPONENT_ANALYSIS_SCHEMA), indent=2) in prompt
+    
     def test_format_step3_prompt(self, sample_findings_schema, sample_step2_results):
         """Test formatting Step 3 prompt"""
         prompt = format_step3_prompt(sample_findings_schema, sample_step2_results)
@@ -167,6 +184,14 @@ class TestPromptTemplates:
         # Check that metadata is included
         assert json.dumps(sample_metadata["component_id"]) in prompt
     
+    def test_format_step3_prompt_with_serialized_results(self, sample_findings_schema, sample_step2_results):
+        """Test that pre-serialized Step 2 results are used as-is"""
+        results_str = json.dumps(sample_step2_results, indent=2)
+        
+        prompt = format_step3_prompt(sample_findings_schema, results_str)
+        
+        assert prompt == format_step3_prompt(sample_findings_schema, sample_step2_results)
+    
     def test_get_system_instruction(self):
         """Test getting system instruction"""
         instruction = get_system_instruction()
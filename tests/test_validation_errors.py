@@ -21,6 +21,7 @@ from utils.validation_errors import (
     validate_json_metadata
 )
 from utils.error_handler import ErrorCategory, ErrorSeverity, ErrorContext
+from utils import validation_constants
 
 
 class TestValidationResult:
@@ -245,6 +246,34 @@ class TestImageValidationError:
         assert result.error_details.code == "VAL_IMG_009"
         assert "corrupted" in result.error_details.user_message
 
+    @pytest.mark.parametrize("width,height,should_pass", [
+        (24, 24, False),
+        (25, 25, True),
+        (30, 20, False),
+        (20, 30, False),
+        (25, 100, True),
+        (100, 25, True),
+    ])
+    def test_validate_image_content_minimum_dimensions(self, width, height, should_pass):
+        """Test the minimum dimension boundary against real encoded images"""
+        img_bytes = io.BytesIO()
+        Image.new('RGB', (width, height), color='red').save(img_bytes, format='JPEG')
+        img_bytes.seek(0)
+
+        result = ImageValidationError.validate_image_content(img_bytes)
+        assert result.is_valid is should_pass
+        if not should_pass:
+            assert result.error_details.code == "VAL_IMG_007"
+
+    def test_limits_match_validation_constants(self):
+        """Test that the class limits come from utils.validation_constants"""
+        assert ImageValidationError.MAX_FILE_SIZE_MB == validation_constants.MAX_FILE_SIZE_MB
+        assert ImageValidationError.MAX_FILE_SIZE_BYTES == validation_constants.MAX_FILE_SIZE_BYTES
+        assert ImageValidationError.MIN_WIDTH == validation_constants.MIN_WIDTH == 25
+        assert ImageValidationError.MIN_HEIGHT == validation_constants.MIN_HEIGHT == 25
+        assert ImageValidationError.MAX_WIDTH == validation_constants.MAX_WIDTH
+        assert ImageValidationError.MAX_HEIGHT == validation_constants.MAX_HEIGHT
+
 
 class TestJSONValidationError:
     """Test JSONValidationError class"""
@@ -7,9 +7,9 @@ multimodal request processing, error handling, and retry logic.
 
 import pytest
 import asyncio
-import base64
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from io import BytesIO
+from collections.abc import Mapping
 
 from services.vertex_ai_client import (
     GeminiClient,
@@ -19,6 +19,7 @@ from services.vertex_ai_client import (
     create_gemini_client
 )
 import google.generativeai as genai
+from google.api_core.exceptions import ServiceUnavailable, TooManyRequests
 
 
 class TestGeminiClient:
@@ -47,8 +48,21 @@ class TestGeminiClient:
     def test_client_initialization(self, gemini_client):
         """Test client initialization"""
         assert gemini_client.model_name == "gemini-2.0-flash-exp"
+        assert gemini_client.max_retries == 3
         assert not gemini_client._initialized
     
+    def test_backoff_delay_jitter_and_cap(self):
+        """Test backoff delays grow exponentially with bounded jitter"""
+        client = GeminiClient(base_delay=1.0, max_delay=30.0, jitter=0.5)
+        
+        with patch('services.vertex_ai_client.random.random', return_value=0.0):
+            assert client._backoff_delay(0) == 1.0
+            assert client._backoff_delay(2) == 4.0
+        
+        with patch('services.vertex_ai_client.random.random', return_value=1.0):
+            assert client._backoff_delay(1) == 3.0
+            assert client._backoff_delay(10) == 30.0
+    
     @patch('services.vertex_ai_client.genai')
     @patch('services.vertex_ai_client.st')
     async def test_initialize_client_success(self, mock_st, mock_genai, gemini_client):
@@ -87,19 +101,14 @@ class TestGeminiClient:
         assert "mime_type" in result
         assert "data" in result
         assert result["mime_type"] == "image/jpeg"
-        assert isinstance(result["data"], str)
-        # Verify it's base64 encoded
-        try:
-            decoded = base64.b64decode(result["data"])
-            assert decoded == sample_image_bytes
-        except Exception:
-            pytest.fail("Failed to decode base64 data")
+        # Raw bytes are passed through without base64 encoding
+        assert result["data"] is sample_image_bytes
     
     def test_get_default_generation_config(self, gemini_client):
         """Test default generation configuration"""
         config = gemini_client._get_default_generation_config()
         
-        assert isinstance(config, dict)
+        assert isinstance(config, Mapping)
         assert "max_output_tokens" in config
         assert "temperature" in config
         assert "top_p" in config
@@ -109,18 +118,22 @@ class TestGeminiClient:
         """Test default safety settings"""
         settings = gemini_client._get_default_safety_settings()
         
-        assert isinstance(settings, list)
+        assert isinstance(settings, tuple)
         assert len(settings) == 4
         for setting in settings:
             assert "category" in setting
             assert "threshold" in setting
+        
+        # Shared defaults are read-only
+        with pytest.raises(TypeError):
+            settings[0]["threshold"] = "BLOCK_NONE"
     
-    @patch('services.vertex_ai_client.asyncio.to_thread')
-    async def test_process_multimodal_request_success(self, mock_to_thread, gemini_client, sample_request):
+    async def test_process_multimodal_request_success(self, gemini_client, sample_request):
         """Test successful multimodal request processing"""
         # Setup
         gemini_client._initialized = True
         gemini_client._model = Mock()
+        mock_generate = gemini_client._model.generate_content_async = AsyncMock()
         
         mock_response = Mock()
         mock_response.text = "Analysis complete: No issues found."
@@ -128,7 +141,7 @@ class TestGeminiClient:
         mock_response.safety_ratings = []
         mock_response.finish_reason = "STOP"
         
-        mock_to_thread.return_value = mock_response
+        mock_generate.return_value = mock_response
         
         with patch.object(gemini_client, '_create_image_data') as mock_create_image:
             mock_create_image.return_value = {"mime_type": "image/jpeg", "data": "base64data"}
@@ -139,24 +152,39 @@ class TestGeminiClient:
             assert result.text == "Analysis complete: No issues found."
             assert result.usage_metadata == {"tokens": 100}
     
+    async def test_process_multimodal_request_reuses_default_settings(self, gemini_client, sample_request):
+        """Test that default generation and safety settings are built once per client"""
+        gemini_client._initialized = True
+        gemini_client._model = Mock()
+        mock_response = Mock()
+        mock_response.text = "Analysis complete"
+        mock_generate = gemini_client._model.generate_content_async = AsyncMock(return_value=mock_response)
+        
+        await gemini_client.process_multimodal_request(sample_request)
+        
+        kwargs = mock_generate.call_args.kwargs
+        assert kwargs["generation_config"] is gemini_client._default_generation_config
+        assert kwargs["safety_settings"] is gemini_client._default_gemini_safety_settings
+        assert len(kwargs["safety_settings"]) == 4
+    
     async def test_process_multimodal_request_not_initialized(self, gemini_client, sample_request):
         """Test multimodal request when client is not initialized"""
         with pytest.raises(GeminiAPIError, match="Client not initialized"):
             await gemini_client.process_multimodal_request(sample_request)
     
-    @patch('services.vertex_ai_client.asyncio.to_thread')
     @patch('services.vertex_ai_client.asyncio.sleep')
-    async def test_process_multimodal_request_retry_logic(self, mock_sleep, mock_to_thread, gemini_client, sample_request):
+    async def test_process_multimodal_request_retry_logic(self, mock_sleep, gemini_client, sample_request):
         """Test retry logic in multimodal request processing"""
         # Setup
         gemini_client._initialized = True
         gemini_client._model = Mock()
+        mock_generate = gemini_client._model.generate_content_async = AsyncMock()
         
         # First call fails, second succeeds
         mock_response = Mock()
         mock_response.text = "Success after retry"
         
-        mock_to_thread.side_effect = [Exception("Temporary failure"), mock_response]
+        mock_generate.side_effect = [ServiceUnavailable("Temporary failure"), mock_response]
         
         with patch.object(gemini_client, '_create_image_data') as mock_create_image:
             mock_create_image.return_value = {"mime_type": "image/jpeg", "data": "base64data"}
@@ -164,17 +192,23 @@ class TestGeminiClient:
             result = await gemini_client.process_multimodal_request(sample_request, max_retries=1)
             
             assert result.text == "Success after retry"
-            assert mock_to_thread.call_count == 2
+            assert mock_generate.call_count == 2
             mock_sleep.assert_called_once()
+            
+            # The image is encoded once and the same part is sent on every attempt
+            mock_create_image.assert_called_once()
+            for call in mock_generate.call_args_list:
+                contents = call.args[0]
+                assert contents[0]["parts"][0]["inline_data"] == mock_create_image.return_value
     
-    @patch('services.vertex_ai_client.asyncio.to_thread')
-    async def test_process_multimodal_request_max_retries_exceeded(self, mock_to_thread, gemini_client, sample_request):
+    async def test_process_multimodal_request_max_retries_exceeded(self, gemini_client, sample_request):
         """Test multimodal request when max retries are exceeded"""
         # Setup
         gemini_client._initialized = True
         gemini_client._model = Mock()
+        mock_generate = gemini_client._model.generate_content_async = AsyncMock()
         
-        mock_to_thread.side_effect = Exception("Persistent failure")
+        mock_generate.side_effect = TooManyRequests("Persistent failure")
         
         with patch.object(gemini_client, '_create_image_data') as mock_create_image:
             mock_create_image.return_value = {"mime_type": "image/jpeg", "data": "base64data"}
@@ -182,6 +216,205 @@ class TestGeminiClient:
             with pytest.raises(GeminiAPIError, match="Request failed after .* retries"):
                 await gemini_client.process_multimodal_request(sample_request, max_retries=2)
     
+    @patch('services.vertex_ai_client.asyncio.sleep')
+    async def test_process_multimodal_request_non_retryable_error(self, mock_sleep, gemini_client, sample_request):
+        """Test that non-transient errors fail without retrying"""
+        gemini_client._initialized = True
+        gemini_client._model = Mock()
+        mock_generate = gemini_client._model.generate_content_async = AsyncMock()
+        
+        mock_generate.side_effect = KeyError("candidates")
+        
+        with pytest.raises(GeminiAPIError, match="Request failed: "):
+            await gemini_client.process_multimodal_request(sample_request, max_retries=2)
+        
+        assert mock_generate.call_count == 1
+        mock_sleep.assert_not_called()
+    
+    async def test_process_multimodal_request_concurrency_cap(self, sample_request):
+        """Test that concurrent requests are capped by max_concurrent"""
+        client = GeminiClient(max_concurrent=2)
+        client._initialized = True
+        client._model = Mock()
+        
+        in_flight = 0
+        peak = 0
+        
+        async def generate(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = Mock()
+            response.text = "Analysis complete"
+            return response
+        
+        client._model.generate_content_async = generate
+        
+        results = await asyncio.gather(
+            *(client.process_multimodal_request(sample_request) for _ in range(6))
+        )
+        
+        assert len(results) == 6
+        assert peak == 2
+    
+    async def test_process_multimodal_request_attempt_timeout_retried(self, sample_request):
+        """Test that a hung attempt times out and is retried"""
+        client = GeminiClient(base_delay=0.0, request_timeout=0.01)
+        client._initialized = True
+        client._model = Mock()
+        
+        mock_response = Mock()
+        mock_response.text = "Success after timeout"
+        hang = asyncio.Event()
+        
+        async def generate(*args, **kwargs):
+            if client._model.generate_content_async.call_count == 1:
+                await hang.wait()
+            return mock_response
+        
+        client._model.generate_content_async = AsyncMock(side_effect=generate)
+        
+        result = await client.process_multimodal_request(sample_request, max_retries=1)
+        
+        assert result.text == "Success after timeout"
+        assert client._model.generate_content_async.call_count == 2
+    
+    async def test_process_multimodal_request_total_timeout(self, sample_request):
+        """Test that retries stop once the overall deadline has passed"""
+        client = GeminiClient(base_delay=0.0, request_timeout=1.0, total_timeout=0.05)
+        client._initialized = True
+        client._model = Mock()
+        hang = asyncio.Event()
+        
+        async def generate(*args, **kwargs):
+            await hang.wait()
+        
+        client._model.generate_content_async = generate
+        
+        with pytest.raises(GeminiAPIError, match="timed out after 0.05s"):
+            await client.process_multimodal_request(sample_request, max_retries=5)
+    
+    @patch('services.vertex_ai_client.asyncio.to_thread')
+    async def test_process_multimodal_request_sync_fallback(self, mock_to_thread, gemini_client, sample_request):
+        """Test the sync SDK call runs in a thread when no async method exists"""
+        gemini_client._initialized = True
+        gemini_client._model = Mock(spec=['generate_content'])
+        
+        mock_response = Mock()
+        mock_response.text = "Analysis complete"
+        mock_to_thread.return_value = mock_response
+        
+        result = await gemini_client.process_multimodal_request(sample_request)
+        
+        assert result.text == "Analysis complete"
+        assert mock_to_thread.call_args.args[0] is gemini_client._model.generate_content
+    
+    async def test_process_multimodal_request_stream_stops_at_object_end(self, gemini_client, sample_request):
+        """Test streamed JSON is returned as soon as the first object closes"""
+        gemini_client._initialized = True
+        gemini_client._model = Mock()
+        
+        pieces = ['Note {draft}. ```json\n{"status": "pa', 'ssed", "note": "a } b", ',
+                  '"issues": [{"id": 1}]}\n```', ' trailing text', ' never read']
+        consumed = []
+        
+        async def stream():
+            for piece in pieces:
+                consumed.append(piece)
+                chunk = Mock()
+                chunk.text = piece
+                yield chunk
+        
+        gemini_client._model.generate_content_async = AsyncMock(return_value=stream())
+        
+        result = await gemini_client.process_multimodal_request_stream(sample_request)
+        
+        assert result == {"status": "passed", "note": "a } b", "issues": [{"id": 1}]}
+        assert len(consumed) == 3
+        assert gemini_client._model.generate_content_async.call_args.kwargs["stream"] is True
+    
+    async def test_process_multimodal_request_stream_without_json(self, gemini_client, sample_request):
+        """Test streamed plain text falls back to parse_structured_response"""
+        gemini_client._initialized = True
+        gemini_client._model = Mock()
+        
+        async def stream():
+            for piece in ["Plain ", "text"]:
+                chunk = Mock()
+                chunk.text = piece
+                yield chunk
+        
+        gemini_client._model.generate_content_async = AsyncMock(return_value=stream())
+        
+        result = await gemini_client.process_multimodal_request_stream(sample_request)
+        
+        assert result == {"text": "Plain text"}
+    
+    async def test_process_multimodal_request_stream_closes_iterator(self, gemini_client, sample_request):
+        """Test the response stream is closed when the JSON ends early"""
+        gemini_client._initialized = True
+        gemini_client._model = Mock()
+        closed = []
+        
+        async def stream():
+            try:
+                for piece in ['{"status": "passed"}', ' trailing text']:
+                    chunk = Mock()
+                    chunk.text = piece
+                    yield chunk
+            finally:
+                closed.append(True)
+        
+        gemini_client._model.generate_content_async = AsyncMock(return_value=stream())
+        
+        result = await gemini_client.process_multimodal_request_stream(sample_request)
+        
+        assert result == {"status": "passed"}
+        assert closed == [True]
+    
+    async def test_process_multimodal_request_stream_sync_fallback(self, gemini_client, sample_request):
+        """Test the blocking SDK stream is read in a thread when no async method exists"""
+        gemini_client._initialized = True
+        gemini_client._model = Mock(spec=['generate_content'])
+        
+        chunks = []
+        for piece in ['{"status": ', '"failed"}']:
+            chunk = Mock()
+            chunk.text = piece
+            chunks.append(chunk)
+        gemini_client._model.generate_content.return_value = iter(chunks)
+        
+        result = await gemini_client.process_multimodal_request_stream(sample_request)
+        
+        assert result == {"status": "failed"}
+        assert gemini_client._model.generate_content.call_args.kwargs["stream"] is True
+    
+    async def test_process_multimodal_request_stream_timeout(self, sample_request):
+        """Test that a hanging stream times out and is closed"""
+        client = GeminiClient(request_timeout=0.05)
+        client._initialized = True
+        client._model = Mock()
+        hang = asyncio.Event()
+        closed = []
+        
+        async def stream():
+            try:
+                chunk = Mock()
+                chunk.text = '{"status": '
+                yield chunk
+                await hang.wait()
+            finally:
+                closed.append(True)
+        
+        client._model.generate_content_async = AsyncMock(return_value=stream())
+        
+        with pytest.raises(GeminiAPIError, match="timed out"):
+            await client.process_multimodal_request_stream(sample_request)
+        
+        assert closed == [True]
+    
     def test_parse_structured_response_json_in_markdown(self, gemini_client):
         """Test parsing structured response with JSON in markdown"""
         response = AIResponse(
@@ -202,6 +435,25 @@ class TestGeminiClient:
         
         assert result == {"status": "failed", "issues": ["Issue 1", "Issue 2"]}
     
+    @patch('services.vertex_ai_client.orjson', None)
+    def test_parse_structured_response_without_orjson(self, gemini_client):
+        """Test parsing falls back to the stdlib json module"""
+        response = AIResponse(text='```json\n{"status": "passed"}\n```')
+        invalid = AIResponse(text='```json\n{"status": passed}\n```')
+        
+        assert gemini_client.parse_structured_response(response) == {"status": "passed"}
+        assert gemini_client.parse_structured_response(invalid) == {"text": invalid.text}
+    
+    def test_parse_structured_response_json_followed_by_text(self, gemini_client):
+        """Test parsing direct JSON followed by text containing braces"""
+        response = AIResponse(
+            text='{"status": "passed", "note": "use {id} format"} Done. See {appendix}.'
+        )
+        
+        result = gemini_client.parse_structured_response(response)
+        
+        assert result == {"status": "passed", "note": "use {id} format"}
+    
     def test_parse_structured_response_no_json(self, gemini_client):
         """Test parsing structured response with no JSON"""
         response = AIResponse(text="This is plain text without JSON.")
@@ -249,6 +501,7 @@ class TestGeminiClient:
         
         assert isinstance(result, bytes)
         assert len(result) > 0
+        assert GeminiClient()._create_test_image() is result
 
 
 class TestCreateGeminiClient:
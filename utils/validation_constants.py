@@ -0,0 +1,17 @@
+"""
+Upload validation limits for DAM Compliance Analyzer.
+
+Kept free of third-party imports so the limits can be read without loading
+Pillow or the rest of the validation stack. ImageValidationError exposes
+them as class attributes.
+"""
+
+# File size limits
+MAX_FILE_SIZE_MB = 10
+MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+
+# Image dimension limits
+MIN_WIDTH = 25
+MIN_HEIGHT = 25
+MAX_WIDTH = 10000
+MAX_HEIGHT = 10000
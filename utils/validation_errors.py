@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from PIL import Image
 import io
 
+from . import validation_constants
 from .error_handler import (
     ErrorCategory,
     ErrorSeverity,
@@ -68,14 +69,14 @@ class ImageValidationError:
     }
     
     # File size limits
-    MAX_FILE_SIZE_MB = 10
-    MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+    MAX_FILE_SIZE_MB = validation_constants.MAX_FILE_SIZE_MB
+    MAX_FILE_SIZE_BYTES = validation_constants.MAX_FILE_SIZE_BYTES
     
     # Image dimension limits
-    MIN_WIDTH = 25
-    MIN_HEIGHT = 25
-    MAX_WIDTH = 10000
-    MAX_HEIGHT = 10000
+    MIN_WIDTH = validation_constants.MIN_WIDTH
+    MIN_HEIGHT = validation_constants.MIN_HEIGHT
+    MAX_WIDTH = validation_constants.MAX_WIDTH
+    MAX_HEIGHT = validation_constants.MAX_HEIGHT
     
     @classmethod
     def validate_file_format(cls, file: Any, context: Optional[ErrorContext] = None) -> ValidationResult: